@@ -1,17 +1,22 @@
 """Auth API module."""
 
 import logging
-import json
+import threading
 
 from splitio.api import APIException
-from splitio.api.commons import headers_from_metadata, record_telemetry
-from splitio.util.time import get_current_epoch_time_ms
+from splitio.api.commons import headers_from_metadata, measured
+from splitio.util import jsonutil
 from splitio.api.client import HttpClientException
 from splitio.models.token import from_raw
 from splitio.models.telemetry import HTTPExceptionsAndLatencies
+from splitio.util.time import get_current_monotonic_ms
 
 _LOGGER = logging.getLogger(__name__)
 
+# Cached tokens are discarded when they have less than this many seconds left. It must be larger
+# than the push manager's refresh grace period so that a scheduled refresh fetches a new token.
+_REFRESH_SKEW = 15 * 60  # 15 minutes
+
 
 class AuthAPI(object):  # pylint: disable=too-few-public-methods
     """Class that uses an httpClient to communicate with the SDK Auth Service API."""
@@ -31,28 +36,68 @@ class AuthAPI(object):  # pylint: disable=too-few-public-methods
         self._sdk_key = sdk_key
         self._metadata = headers_from_metadata(sdk_metadata)
         self._telemetry_runtime_producer = telemetry_runtime_producer
+        self._cached_token = None
+        self._cached_at_ms = None  # monotonic time at which the cached token was fetched
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Discard the cached token, forcing the next authentication to hit the backend."""
+        with self._lock:
+            self._cached_token = None
 
     def authenticate(self):
         """
         Perform authentication.
 
+        A previously fetched token is returned while it's still valid.
+
+        :return: Json representation of an authentication.
+        :rtype: splitio.models.token.Token
+        """
+        with self._lock:
+            if self._cached_token is not None and self._cached_token_life() > _REFRESH_SKEW:
+                return self._cached_token
+
+            token = self._fetch_token()
+            self._cached_token = token if token is not None and token.push_enabled else None
+            self._cached_at_ms = get_current_monotonic_ms()
+            return token
+
+    def _cached_token_life(self):
+        """
+        Return the seconds the cached token has left.
+
+        Measured from the token's own lifetime and the local time elapsed since it was fetched,
+        so that it's not affected by skew between the local and the backend clocks.
+
+        :return: remaining seconds of validity.
+        :rtype: float
+        """
+        elapsed = (get_current_monotonic_ms() - self._cached_at_ms) / 1000
+        return (self._cached_token.exp - self._cached_token.iat) - elapsed
+
+    def _fetch_token(self):
+        """
+        Issue the authentication request.
+
         :return: Json representation of an authentication.
         :rtype: splitio.models.token.Token
         """
-        start = get_current_epoch_time_ms()
         try:
-            response = self._client.get(
-                'auth',
-                '/v2/auth',
-                self._sdk_key,
-                extra_headers=self._metadata,
-            )
-            record_telemetry(response.status_code, get_current_epoch_time_ms() - start, HTTPExceptionsAndLatencies.TOKEN, self._telemetry_runtime_producer)
+            with measured(self._telemetry_runtime_producer, HTTPExceptionsAndLatencies.TOKEN) as measurement:
+                response = self._client.get(
+                    'auth',
+                    '/v2/auth',
+                    self._sdk_key,
+                    extra_headers=self._metadata,
+                )
+                measurement.status = response.status_code
             if 200 <= response.status_code < 300:
-                payload = json.loads(response.body)
+                payload = jsonutil.loads(response.body)
                 return from_raw(payload)
             else:
                 if (response.status_code >= 400 and response.status_code < 500):
+                    self._cached_token = None
                     self._telemetry_runtime_producer.record_auth_rejections()
                 raise APIException(response.body, response.status_code)
         except HttpClientException as exc:
@@ -1,11 +1,21 @@
 """Synchronous HTTP Client for split API."""
 from collections import namedtuple
+from http.cookiejar import DefaultCookiePolicy
+import os
+import threading
 
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 _LOGGER = logging.getLogger(__name__)
 
-HttpResponse = namedtuple('HttpResponse', ['status_code', 'body'])
+_POOL_CONNECTIONS = 4  # one pool per backend host: sdk, events, auth & telemetry
+_POOL_MAXSIZE = 10  # max concurrent connections kept alive per host
+
+HttpResponse = namedtuple('HttpResponse', ['status_code', 'body', 'headers'])
+
+# pre-python3.7 hack to make headers optional
+HttpResponse.__new__.__defaults__ = (None,)
 
 class HttpClientException(Exception):
     """HTTP Client exception."""
@@ -50,6 +60,36 @@ class HttpClient(object):
             'auth': auth_url if auth_url is not None else self.AUTH_URL,
             'telemetry': telemetry_url if telemetry_url is not None else self.TELEMETRY_URL,
         }
+        self._session = None  # (pid of the owner process, session) pair, swapped atomically
+        self._session_lock = threading.Lock()
+
+    def _get_session(self):
+        """
+        Return the session shared by every request issued through this client.
+
+        Connections are kept alive and reused across calls. The session is rebuilt
+        after a fork so that processes never share sockets.
+
+        :return: A pooled session.
+        :rtype: requests.Session
+        """
+        pid = os.getpid()
+        current = self._session
+        if current is not None and current[0] == pid:
+            return current[1]
+
+        with self._session_lock:
+            current = self._session
+            if current is None or current[0] != pid:
+                session = requests.Session()
+                # requests.get/post never kept cookies between calls, neither does the shared session
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                current = (pid, session)
+                self._session = current
+            return current[1]
 
     def _build_url(self, server, path):
         """
@@ -93,7 +133,7 @@ class HttpClient(object):
         :param extra_headers: key/value pairs of possible extra headers.
         :type extra_headers: dict
 
-        :return: Tuple of status_code & response text
+        :return: Tuple of status_code, response text & response headers
         :rtype: HttpResponse
         """
         headers = self._build_basic_headers(sdk_key)
@@ -101,13 +141,13 @@ class HttpClient(object):
             headers.update(extra_headers)
 
         try:
-            response = requests.get(
+            response = self._get_session().get(
                 self._build_url(server, path),
                 params=query,
                 headers=headers,
                 timeout=self._timeout
             )
-            return HttpResponse(response.status_code, response.text)
+            return HttpResponse(response.status_code, response.text, response.headers)
         except Exception as exc:  # pylint: disable=broad-except
             raise HttpClientException('requests library is throwing exceptions') from exc
 
@@ -137,7 +177,7 @@ class HttpClient(object):
             headers.update(extra_headers)
 
         try:
-            response = requests.post(
+            response = self._get_session().post(
                 self._build_url(server, path),
                 json=body,
                 params=query,
@@ -1,5 +1,7 @@
 """Commons module."""
-from splitio.util.time import get_current_epoch_time_ms
+from contextlib import contextmanager
+
+from splitio.util.time import get_current_epoch_time_ms, get_current_monotonic_ms
 
 _CACHE_CONTROL = 'Cache-Control'
 _CACHE_CONTROL_NO_CACHE = 'no-cache'
@@ -49,11 +51,44 @@ def record_telemetry(status_code, elapsed, metric_name, telemetry_runtime_produc
     :type telemetry_runtime_producer: splitio.engine.telemetry.TelemetryRuntimeProducer
     """
     telemetry_runtime_producer.record_sync_latency(metric_name, elapsed)
-    if 200 <= status_code < 300:
+    if 200 <= status_code < 300 or status_code == 304:
         telemetry_runtime_producer.record_successful_sync(metric_name, get_current_epoch_time_ms())
         return
     telemetry_runtime_producer.record_sync_error(metric_name, status_code)
 
+
+class _Measurement(object):  # pylint: disable=too-few-public-methods
+    """Holds the status code of a measured request."""
+
+    def __init__(self):
+        """Class constructor."""
+        self.status = None
+
+
+@contextmanager
+def measured(telemetry_runtime_producer, metric_name):
+    """
+    Measure the latency of the enclosed request and record its telemetry.
+
+    The enclosed block must set the status code of the response on the yielded object.
+    Nothing is recorded if the block raises or leaves the status unset.
+
+    :param telemetry_runtime_producer: telemetry recording instance
+    :type telemetry_runtime_producer: splitio.engine.telemetry.TelemetryRuntimeProducer
+
+    :param metric_name: metric name for telemetry
+    :type metric_name: str
+
+    :return: measurement whose status must be set
+    :rtype: _Measurement
+    """
+    measurement = _Measurement()
+    start = get_current_monotonic_ms()
+    yield measurement
+    if measurement.status is not None:
+        record_telemetry(measurement.status, get_current_monotonic_ms() - start, metric_name, telemetry_runtime_producer)
+
+
 class FetchOptions(object):
     """Fetch Options object."""
 
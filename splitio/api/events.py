@@ -4,8 +4,7 @@ import time
 
 from splitio.api import APIException
 from splitio.api.client import HttpClientException
-from splitio.api.commons import headers_from_metadata, record_telemetry
-from splitio.util.time import get_current_epoch_time_ms
+from splitio.api.commons import headers_from_metadata, measured
 from splitio.models.telemetry import HTTPExceptionsAndLatencies
 
 
@@ -65,16 +64,16 @@ class EventsAPI(object):  # pylint: disable=too-few-public-methods
         :rtype: bool
         """
         bulk = self._build_bulk(events)
-        start = get_current_epoch_time_ms()
         try:
-            response = self._client.post(
-                'events',
-                '/events/bulk',
-                self._sdk_key,
-                body=bulk,
-                extra_headers=self._metadata,
-            )
-            record_telemetry(response.status_code, get_current_epoch_time_ms() - start, HTTPExceptionsAndLatencies.EVENT, self._telemetry_runtime_producer)
+            with measured(self._telemetry_runtime_producer, HTTPExceptionsAndLatencies.EVENT) as measurement:
+                response = self._client.post(
+                    'events',
+                    '/events/bulk',
+                    self._sdk_key,
+                    body=bulk,
+                    extra_headers=self._metadata,
+                )
+                measurement.status = response.status_code
             if not 200 <= response.status_code < 300:
                 raise APIException(response.body, response.status_code)
         except HttpClientException as exc:
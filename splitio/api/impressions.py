@@ -1,12 +1,11 @@
 """Impressions API module."""
 
 import logging
-from itertools import groupby
+from collections import defaultdict
 
 from splitio.api import APIException
 from splitio.api.client import HttpClientException
-from splitio.api.commons import headers_from_metadata, record_telemetry
-from splitio.util.time import get_current_epoch_time_ms
+from splitio.api.commons import headers_from_metadata, measured
 from splitio.engine.impressions import ImpressionsMode
 from splitio.models.telemetry import HTTPExceptionsAndLatencies
 
@@ -43,27 +42,20 @@ class ImpressionsAPI(object):  # pylint: disable=too-few-public-methods
         :return: Dictionary of lists of impressions.
         :rtype: list
         """
-        return [
-            {
-                'f': test_name,
-                'i': [
-                    {
-                        'k': impression.matching_key,
-                        't': impression.treatment,
-                        'm': impression.time,
-                        'c': impression.change_number,
-                        'r': impression.label,
-                        'b': impression.bucketing_key,
-                        'pt': impression.previous_time
-                    }
-                    for impression in imps
-                ]
-            }
-            for (test_name, imps) in groupby(
-                sorted(impressions, key=lambda i: i.feature_name),
-                lambda i: i.feature_name
-            )
-        ]
+        by_feature = defaultdict(list)
+        for (matching_key, feature_name, treatment, label, change_number,
+             bucketing_key, time, previous_time) in impressions:
+            by_feature[feature_name].append({
+                'k': matching_key,
+                't': treatment,
+                'm': time,
+                'c': change_number,
+                'r': label,
+                'b': bucketing_key,
+                'pt': previous_time
+            })
+
+        return [{'f': feature_name, 'i': imps} for feature_name, imps in by_feature.items()]
 
     @staticmethod
     def _build_counters(counters):
@@ -94,16 +86,16 @@ class ImpressionsAPI(object):  # pylint: disable=too-few-public-methods
         :type impressions: list
         """
         bulk = self._build_bulk(impressions)
-        start = get_current_epoch_time_ms()
         try:
-            response = self._client.post(
-                'events',
-                '/testImpressions/bulk',
-                self._sdk_key,
-                body=bulk,
-                extra_headers=self._metadata,
-            )
-            record_telemetry(response.status_code, get_current_epoch_time_ms() - start, HTTPExceptionsAndLatencies.IMPRESSION, self._telemetry_runtime_producer)
+            with measured(self._telemetry_runtime_producer, HTTPExceptionsAndLatencies.IMPRESSION) as measurement:
+                response = self._client.post(
+                    'events',
+                    '/testImpressions/bulk',
+                    self._sdk_key,
+                    body=bulk,
+                    extra_headers=self._metadata,
+                )
+                measurement.status = response.status_code
             if not 200 <= response.status_code < 300:
                 raise APIException(response.body, response.status_code)
         except HttpClientException as exc:
@@ -121,16 +113,16 @@ class ImpressionsAPI(object):  # pylint: disable=too-few-public-methods
         :type impressions: list
         """
         bulk = self._build_counters(counters)
-        start = get_current_epoch_time_ms()
         try:
-            response = self._client.post(
-                'events',
-                '/testImpressions/count',
-                self._sdk_key,
-                body=bulk,
-                extra_headers=self._metadata,
-            )
-            record_telemetry(response.status_code, get_current_epoch_time_ms() - start, HTTPExceptionsAndLatencies.IMPRESSION_COUNT, self._telemetry_runtime_producer)
+            with measured(self._telemetry_runtime_producer, HTTPExceptionsAndLatencies.IMPRESSION_COUNT) as measurement:
+                response = self._client.post(
+                    'events',
+                    '/testImpressions/count',
+                    self._sdk_key,
+                    body=bulk,
+                    extra_headers=self._metadata,
+                )
+                measurement.status = response.status_code
             if not 200 <= response.status_code < 300:
                 raise APIException(response.body, response.status_code)
         except HttpClientException as exc:
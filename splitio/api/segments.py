@@ -5,8 +5,7 @@ import logging
 import time
 
 from splitio.api import APIException
-from splitio.api.commons import headers_from_metadata, build_fetch, record_telemetry
-from splitio.util.time import get_current_epoch_time_ms
+from splitio.api.commons import headers_from_metadata, build_fetch, measured
 from splitio.api.client import HttpClientException
 from splitio.models.telemetry import HTTPExceptionsAndLatencies
 
@@ -50,17 +49,17 @@ class SegmentsAPI(object):  # pylint: disable=too-few-public-methods
         :return: Json representation of a segmentChange response.
         :rtype: dict
         """
-        start = get_current_epoch_time_ms()
         try:
             query, extra_headers = build_fetch(change_number, fetch_options, self._metadata)
-            response = self._client.get(
-                'sdk',
-                '/segmentChanges/{segment_name}'.format(segment_name=segment_name),
-                self._sdk_key,
-                extra_headers=extra_headers,
-                query=query,
-            )
-            record_telemetry(response.status_code, get_current_epoch_time_ms() - start, HTTPExceptionsAndLatencies.SEGMENT, self._telemetry_runtime_producer)
+            with measured(self._telemetry_runtime_producer, HTTPExceptionsAndLatencies.SEGMENT) as measurement:
+                response = self._client.get(
+                    'sdk',
+                    '/segmentChanges/{segment_name}'.format(segment_name=segment_name),
+                    self._sdk_key,
+                    extra_headers=extra_headers,
+                    query=query,
+                )
+                measurement.status = response.status_code
             if 200 <= response.status_code < 300:
                 return json.loads(response.body)
             else:
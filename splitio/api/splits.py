@@ -5,13 +5,15 @@ import json
 import time
 
 from splitio.api import APIException
-from splitio.api.commons import headers_from_metadata, build_fetch, record_telemetry
-from splitio.util.time import get_current_epoch_time_ms
+from splitio.api.commons import headers_from_metadata, build_fetch, measured
 from splitio.api.client import HttpClientException
 from splitio.models.telemetry import HTTPExceptionsAndLatencies
 
 _LOGGER = logging.getLogger(__name__)
 
+_ETAG = 'ETag'
+_IF_NONE_MATCH = 'If-None-Match'
+
 
 class SplitsAPI(object):  # pylint: disable=too-few-public-methods
     """Class that uses an httpClient to communicate with the splits API."""
@@ -31,11 +33,15 @@ class SplitsAPI(object):  # pylint: disable=too-few-public-methods
         self._sdk_key = sdk_key
         self._metadata = headers_from_metadata(sdk_metadata)
         self._telemetry_runtime_producer = telemetry_runtime_producer
+        self._last_etag = None  # (since, till, etag) of the last successful request
 
     def fetch_splits(self, change_number, fetch_options):
         """
         Fetch feature flags from backend.
 
+        When the backend reports the feature flags as not modified since the last identical
+        request, an empty change set with since == till is returned without parsing anything.
+
         :param change_number: Last known timestamp of a split modification.
         :type change_number: int
 
@@ -45,18 +51,26 @@ class SplitsAPI(object):  # pylint: disable=too-few-public-methods
         :return: Json representation of a splitChanges response.
         :rtype: dict
         """
-        start = get_current_epoch_time_ms()
         try:
             query, extra_headers = build_fetch(change_number, fetch_options, self._metadata)
-            response = self._client.get(
-                'sdk',
-                '/splitChanges',
-                self._sdk_key,
-                extra_headers=extra_headers,
-                query=query,
-            )
-            record_telemetry(response.status_code, get_current_epoch_time_ms() - start, HTTPExceptionsAndLatencies.SPLIT, self._telemetry_runtime_producer)
+            last_etag = self._last_etag
+            request_key = (query['since'], query.get('till'))
+            if last_etag is not None and last_etag[:2] == request_key:
+                extra_headers = dict(extra_headers, **{_IF_NONE_MATCH: last_etag[2]})
+            with measured(self._telemetry_runtime_producer, HTTPExceptionsAndLatencies.SPLIT) as measurement:
+                response = self._client.get(
+                    'sdk',
+                    '/splitChanges',
+                    self._sdk_key,
+                    extra_headers=extra_headers,
+                    query=query,
+                )
+                measurement.status = response.status_code
+            if response.status_code == 304:
+                return {'since': change_number, 'till': change_number, 'splits': []}
             if 200 <= response.status_code < 300:
+                etag = response.headers.get(_ETAG) if response.headers else None
+                self._last_etag = request_key + (etag,) if etag else None
                 return json.loads(response.body)
             else:
                 raise APIException(response.body, response.status_code)
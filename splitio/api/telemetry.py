@@ -3,8 +3,7 @@ import logging
 
 from splitio.api import APIException
 from splitio.api.client import HttpClientException
-from splitio.api.commons import headers_from_metadata, record_telemetry
-from splitio.util.time import get_current_epoch_time_ms
+from splitio.api.commons import headers_from_metadata, measured
 from splitio.models.telemetry import HTTPExceptionsAndLatencies
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,16 +32,16 @@ class TelemetryAPI(object):  # pylint: disable=too-few-public-methods
         :param uniques: Unique Keys
         :type json
         """
-        start = get_current_epoch_time_ms()
         try:
-            response = self._client.post(
-                'telemetry',
-                '/v1/keys/ss',
-                self._sdk_key,
-                body=uniques,
-                extra_headers=self._metadata
-            )
-            record_telemetry(response.status_code,  get_current_epoch_time_ms() - start, HTTPExceptionsAndLatencies.TELEMETRY, self._telemetry_runtime_producer)
+            with measured(self._telemetry_runtime_producer, HTTPExceptionsAndLatencies.TELEMETRY) as measurement:
+                response = self._client.post(
+                    'telemetry',
+                    '/v1/keys/ss',
+                    self._sdk_key,
+                    body=uniques,
+                    extra_headers=self._metadata
+                )
+                measurement.status = response.status_code
             if not 200 <= response.status_code < 300:
                 raise APIException(response.body, response.status_code)
         except HttpClientException as exc:
@@ -59,16 +58,16 @@ class TelemetryAPI(object):  # pylint: disable=too-few-public-methods
         :param configs: configs
         :type json
         """
-        start = get_current_epoch_time_ms()
         try:
-            response = self._client.post(
-                'telemetry',
-                '/v1/metrics/config',
-                self._sdk_key,
-                body=configs,
-                extra_headers=self._metadata,
-            )
-            record_telemetry(response.status_code, get_current_epoch_time_ms() - start, HTTPExceptionsAndLatencies.TELEMETRY, self._telemetry_runtime_producer)
+            with measured(self._telemetry_runtime_producer, HTTPExceptionsAndLatencies.TELEMETRY) as measurement:
+                response = self._client.post(
+                    'telemetry',
+                    '/v1/metrics/config',
+                    self._sdk_key,
+                    body=configs,
+                    extra_headers=self._metadata,
+                )
+                measurement.status = response.status_code
             if not 200 <= response.status_code < 300:
                 raise APIException(response.body, response.status_code)
         except HttpClientException as exc:
@@ -85,16 +84,16 @@ class TelemetryAPI(object):  # pylint: disable=too-few-public-methods
         :param stats: stats
         :type json
         """
-        start = get_current_epoch_time_ms()
         try:
-            response = self._client.post(
-                'telemetry',
-                '/v1/metrics/usage',
-                self._sdk_key,
-                body=stats,
-                extra_headers=self._metadata,
-            )
-            record_telemetry(response.status_code, get_current_epoch_time_ms() - start, HTTPExceptionsAndLatencies.TELEMETRY, self._telemetry_runtime_producer)
+            with measured(self._telemetry_runtime_producer, HTTPExceptionsAndLatencies.TELEMETRY) as measurement:
+                response = self._client.post(
+                    'telemetry',
+                    '/v1/metrics/usage',
+                    self._sdk_key,
+                    body=stats,
+                    extra_headers=self._metadata,
+                )
+                measurement.status = response.status_code
             if not 200 <= response.status_code < 300:
                 raise APIException(response.body, response.status_code)
         except HttpClientException as exc:
@@ -1,5 +1,6 @@
 """A module for Split.io SDK API clients."""
 import logging
+import sys
 
 from splitio.engine.evaluator import Evaluator, CONTROL
 from splitio.engine.splitters import Splitter
@@ -7,7 +8,7 @@ from splitio.models.impressions import Impression, Label
 from splitio.models.events import Event, EventWrapper
 from splitio.models.telemetry import get_latency_bucket_index, MethodExceptionsAndLatencies
 from splitio.client import input_validator
-from splitio.util.time import get_current_epoch_time_ms, utctime_ms
+from splitio.util.time import get_current_monotonic_ms, utctime_ms
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -87,7 +88,7 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
                 _LOGGER.error("Client is not ready - no calls possible")
                 return CONTROL, None
 
-            start = get_current_epoch_time_ms()
+            start = get_current_monotonic_ms()
 
             matching_key, bucketing_key = input_validator.validate_key(key, method_name)
             feature_flag = input_validator.validate_feature_flag_name(
@@ -144,7 +145,7 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
             _LOGGER.error("Client is not ready - no calls possible")
             return input_validator.generate_control_treatments(feature_flags, method_name)
 
-        start = get_current_epoch_time_ms()
+        start = get_current_monotonic_ms()
 
         matching_key, bucketing_key = input_validator.validate_key(key, method_name)
         if matching_key is None and bucketing_key is None:
@@ -323,11 +324,15 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
         if not self._labels_enabled:
             label = None
 
-        return Impression(
-            matching_key=matching_key, feature_name=feature_flag_name,
-            treatment=treatment, label=label, change_number=change_number,
-            bucketing_key=bucketing_key, time=imp_time
-        )
+        # Treatments & labels already come from the shared feature flag definitions, but names are
+        # user supplied, so they're interned to share a single instance across queued impressions.
+        try:
+            feature_flag_name = sys.intern(feature_flag_name)
+        except TypeError:  # only exact str instances can be interned, keep anything else as is
+            pass
+
+        return Impression(matching_key, feature_flag_name, treatment, label,
+                          change_number, bucketing_key, imp_time)
 
     def _record_stats(self, impressions, start, operation, method_name=None):
         """
@@ -336,13 +341,13 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
         :param impressions: Generated impressions
         :type impressions: list[tuple[splitio.models.impression.Impression, dict]]
 
-        :param start: timestamp when get_treatment or get_treatments was called
+        :param start: monotonic timestamp when get_treatment or get_treatments was called
         :type start: int
 
         :param operation: operation performed.
         :type operation: str
         """
-        end = get_current_epoch_time_ms()
+        end = get_current_monotonic_ms()
         self._recorder.record_treatment_stats(impressions, get_latency_bucket_index(end - start),
                                               operation, method_name)
 
@@ -374,7 +379,7 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
             _LOGGER.warning("track: the SDK is not ready, results may be incorrect. Make sure to wait for SDK readiness before using this method")
             self._telemetry_init_producer.record_not_ready_usage()
 
-        start = get_current_epoch_time_ms()
+        start = get_current_monotonic_ms()
         key = input_validator.validate_track_key(key)
         event_type = input_validator.validate_event_type(event_type)
         should_validate_existance = self.ready and self._factory._sdk_key != 'localhost'  # pylint: disable=protected-access
@@ -404,7 +409,7 @@ class Client(object):  # pylint: disable=too-many-instance-attributes
             return_flag = self._recorder.record_track_stats([EventWrapper(
                 event=event,
                 size=size,
-            )], get_latency_bucket_index(get_current_epoch_time_ms() - start))
+            )], get_latency_bucket_index(get_current_monotonic_ms() - start))
             return return_flag
         except Exception:  # pylint: disable=broad-except
             self._telemetry_evaluation_producer.record_exception(MethodExceptionsAndLatencies.TRACK)
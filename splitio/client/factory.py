@@ -35,7 +35,7 @@ from splitio.api.impressions import ImpressionsAPI
 from splitio.api.events import EventsAPI
 from splitio.api.auth import AuthAPI
 from splitio.api.telemetry import TelemetryAPI
-from splitio.util.time import get_current_epoch_time_ms
+from splitio.util.time import get_current_monotonic_ms
 
 # Tasks
 from splitio.tasks.split_sync import SplitSynchronizationTask
@@ -130,7 +130,7 @@ class SplitFactory(object):  # pylint: disable=too-many-instance-attributes
         self._telemetry_evaluation_producer = telemetry_producer.get_telemetry_evaluation_producer()
         self._telemetry_init_producer = telemetry_init_producer
         self._telemetry_submitter = telemetry_submitter
-        self._ready_time = get_current_epoch_time_ms()
+        self._ready_time = get_current_monotonic_ms()
         self._start_status_updater()
 
     def _start_status_updater(self):
@@ -157,7 +157,7 @@ class SplitFactory(object):  # pylint: disable=too-many-instance-attributes
         self._sdk_internal_ready_flag.wait()
         self._status = Status.READY
         self._sdk_ready_flag.set()
-        self._telemetry_init_producer.record_ready_time(get_current_epoch_time_ms() - self._ready_time)
+        self._telemetry_init_producer.record_ready_time(get_current_monotonic_ms() - self._ready_time)
         redundant_factory_count, active_factory_count = _get_active_and_redundant_count()
         self._telemetry_init_producer.record_active_and_redundant_factories(active_factory_count, redundant_factory_count)
 
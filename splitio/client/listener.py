@@ -50,6 +50,18 @@ class ImpressionListenerWrapper(object):  # pylint: disable=too-few-public-metho
         except Exception as exc:  # pylint: disable=broad-except
             raise ImpressionListenerException('Error in log_impression user\'s method is throwing exceptions') from exc
 
+    def log_impressions(self, impressions):
+        """
+        Send a batch of impressions to the user-provided listener, one at a time.
+
+        Stops at the first impression the listener fails to handle.
+
+        :param impressions: Impressions along with the attributes used to evaluate them
+        :type impressions: list[tuple[splitio.models.impressions.Impression, dict]]
+        """
+        for impression, attributes in impressions:
+            self.log_impression(impression, attributes)
+
 
 class ImpressionListener(object, metaclass=abc.ABCMeta):
     """Impression listener interface."""
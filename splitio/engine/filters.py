@@ -60,7 +60,7 @@ class BloomFilter(BaseFilter):
         """
         with self._lock:
             self._imps_bloom_filter.add(data)
-            return data in self._imps_bloom_filter
+            return True
 
     def contains(self, data):
         """
@@ -39,23 +39,23 @@ class Manager(object):  # pylint:disable=too-few-public-methods
         :type impressions: list[tuple[splitio.models.impression.Impression, dict]]
         """
         for_log, for_listener = self._strategy.process_impressions(impressions)
-        if len(impressions) > len(for_log):
-            self._telemetry_runtime_producer.record_impression_stats(telemetry.CounterConstants.IMPRESSIONS_DEDUPED, len(impressions) - len(for_log))
-        self._send_impressions_to_listener(for_listener)
+        deduped = len(impressions) - len(for_log)
+        if deduped > 0:
+            self._telemetry_runtime_producer.record_impression_stats(telemetry.CounterConstants.IMPRESSIONS_DEDUPED, deduped)
+        if self._listener is not None:  # checked here, most setups have no listener & batches are usually 1 impression
+            self._send_impressions_to_listener(for_listener)
         return for_log
 
     def _send_impressions_to_listener(self, impressions):
         """
-        Send impression result to custom listener.
+        Send impression result to custom listener, which must be set.
 
         :param impressions: List of impression objects with attributes
         :type impressions: list[tuple[splitio.models.impression.Impression, dict]]
         """
-        if self._listener is not None:
-            try:
-                for impression, attributes in impressions:
-                    self._listener.log_impression(impression, attributes)
-            except ImpressionListenerException:
-                pass
-#                self._logger.error('An exception was raised while calling user-custom impression listener')
-#                self._logger.debug('Error', exc_info=True)
+        try:
+            self._listener.log_impressions(impressions)
+        except ImpressionListenerException:
+            pass
+#            self._logger.error('An exception was raised while calling user-custom impression listener')
+#            self._logger.debug('Error', exc_info=True)
@@ -1,12 +1,59 @@
+import hashlib
+import sys
 import threading
 from splitio.util.time import utctime_ms
-from splitio.models.impressions import Impression
-from splitio.engine.hashfns import murmur_128
 from splitio.engine.cache.lru import SimpleLruCache
-from collections import defaultdict, namedtuple
+import collections
+from collections import namedtuple
 
 _TIME_INTERVAL_MS = 3600 * 1000  # one hour
 
+def blake2b_64(key, seed):
+    """
+    Hash a string into a 64 bits integer using blake2b.
+
+    Impression hashes are only used locally to detect duplicates, so any well distributed
+    hash works. blake2b is implemented in C in the standard library and, unlike murmur3,
+    doesn't fall back to a pure python implementation when mmh3cffi is not installed.
+
+    :param key: string to hash
+    :type key: str
+    :param seed: seed to be provided when hashing
+    :type seed: int
+
+    :returns: 64 bits hash
+    :rtype: int
+    """
+    data = key.encode('utf-8')
+    if seed:
+        digest = hashlib.blake2b(data, digest_size=8, salt=seed.to_bytes(16, 'little', signed=True))
+    else:
+        digest = hashlib.blake2b(data, digest_size=8)  # all zeros is blake2b's default salt
+    return int.from_bytes(digest.digest(), 'little')
+
+def str_hash_64(key, seed):
+    """
+    Hash a string into a 64 bits integer using the interpreter's own string hash.
+
+    The string hash (SipHash) runs in C without encoding the key first, and is keyed
+    with a random secret per process. That's fine here since impression hashes never
+    leave the process, and it's roughly twice as fast as blake2b_64.
+
+    :param key: string to hash
+    :type key: str
+    :param seed: seed to be provided when hashing
+    :type seed: int
+
+    :returns: 64 bits hash, which unlike blake2b_64 can be negative
+    :rtype: int
+    """
+    return hash((seed, key))
+
+# Impression hashes are used as observer cache keys without comparing the impressions themselves.
+# 64 bits keep the odds of a collision within a full cache (500000 entries) around 1e-8, but the
+# interpreter's hash is only 32 bits wide on 32 bits builds, so blake2b_64 is used there instead.
+_DEFAULT_HASH_FN = str_hash_64 if sys.hash_info.width >= 64 else blake2b_64
+
 def truncate_time(timestamp_ms):
     """
     Truncate a timestamp in milliseconds to have hour granularity.
@@ -39,9 +86,9 @@ def truncate_impressions_time(imps, counter = None):
 class Hasher(object):  # pylint:disable=too-few-public-methods
     """Impression hasher."""
 
-    _PATTERN = "%s:%s:%s:%s:%d"
+    _PATTERN = "%s\x1f%s\x1f%s\x1f%s\x1f%d"  # fields joined by the ASCII unit separator
 
-    def __init__(self, hash_fn=murmur_128, seed=0):
+    def __init__(self, hash_fn=_DEFAULT_HASH_FN, seed=0):
         """
         Class constructor.
 
@@ -64,11 +111,13 @@ class Hasher(object):  # pylint:disable=too-few-public-methods
         :returns: a string representation of the impression
         :rtype: str
         """
-        return self._PATTERN % (impression.matching_key if impression.matching_key else 'UNKNOWN',
-                                impression.feature_name if impression.feature_name else 'UNKNOWN',
-                                impression.treatment if impression.treatment else 'UNKNOWN',
-                                impression.label if impression.label else 'UNKNOWN',
-                                impression.change_number if impression.change_number else 0)
+        # matching_key, feature_name, treatment, label & change_number lead the namedtuple
+        matching_key, feature_name, treatment, label, change_number = impression[:5]
+        return self._PATTERN % (matching_key or 'UNKNOWN',
+                                feature_name or 'UNKNOWN',
+                                treatment or 'UNKNOWN',
+                                label or 'UNKNOWN',
+                                change_number or 0)
 
     def process(self, impression):
         """
@@ -90,6 +139,9 @@ class Observer(object):  # pylint:disable=too-few-public-methods
         """Class constructor."""
         self._hasher = Hasher()
         self._cache = SimpleLruCache(size)
+        # bound methods called once per impression
+        self._hash = self._hasher.process
+        self._cache_test_and_set = self._cache.test_and_set
 
     def test_and_set(self, impression):
         """
@@ -101,26 +153,20 @@ class Observer(object):  # pylint:disable=too-few-public-methods
         :returns: Impression with populated previous time
         :rtype: splitio.models.impressions.Impression
         """
-        previous_time = self._cache.test_and_set(self._hasher.process(impression), impression.time)
-        return Impression(impression.matching_key,
-                          impression.feature_name,
-                          impression.treatment,
-                          impression.label,
-                          impression.change_number,
-                          impression.bucketing_key,
-                          impression.time,
-                          previous_time)
+        previous_time = self._cache_test_and_set(self._hash(impression), impression.time)
+        if previous_time == impression.previous_time:
+            return impression  # impressions are immutable, no need to build a new one
+        return impression._replace(previous_time=previous_time)
 
 
 class Counter(object):
     """Class that counts impressions per timeframe."""
 
-    CounterKey = namedtuple('Count', ['feature', 'timeframe'])
     CountPerFeature = namedtuple('CountPerFeature', ['feature', 'timeframe', 'count'])
 
     def __init__(self):
         """Class constructor."""
-        self._data = defaultdict(lambda: 0)
+        self._data = collections.Counter()  # (feature, hours since epoch) -> count
         self._lock = threading.Lock()
 
     def track(self, impressions, inc=1):
@@ -133,8 +179,12 @@ class Counter(object):
         :param inc: amount to increment (defaults to 1)
         :type inc: int
         """
-        keys = [Counter.CounterKey(i.feature_name, truncate_time(i.time)) for i in impressions]
+        # timeframes are kept as hours since epoch until popped, a single division per impression
+        keys = [(i.feature_name, i.time // _TIME_INTERVAL_MS) for i in impressions]
         with self._lock:
+            if inc == 1:
+                self._data.update(keys)  # counts the whole batch in C
+                return
             for key in keys:
                 self._data[key] += inc
 
@@ -147,7 +197,8 @@ class Counter(object):
         """
         with self._lock:
             old = self._data
-            self._data = defaultdict(lambda: 0)
+            self._data = collections.Counter()
 
-        return [Counter.CountPerFeature(k.feature, k.timeframe, v)
-                for (k, v) in old.items()]
\ No newline at end of file
+        # a list (not a generator) so that callers can bail out early when there's nothing to send
+        return [Counter.CountPerFeature(feature, hour * _TIME_INTERVAL_MS, count)
+                for (feature, hour), count in old.items()]
\ No newline at end of file
@@ -40,7 +40,8 @@ class StrategyDebugMode(BaseStrategy):
         :returns: Observed list of impressions
         :rtype: list[tuple[splitio.models.impression.Impression, dict]]
         """
-        imps = [(self._observer.test_and_set(imp), attrs) for imp, attrs in impressions]
+        test_and_set = self._observer.test_and_set
+        imps = [(test_and_set(imp), attrs) for imp, attrs in impressions]
         return [i for i, _ in imps], imps
 
 class StrategyNoneMode(BaseStrategy):
@@ -98,7 +99,19 @@ class StrategyOptimizedMode(BaseStrategy):
         :returns: Observed list of impressions
         :rtype: list[tuple[splitio.models.impression.Impression, dict]]
         """
-        imps = [(self._observer.test_and_set(imp), attrs) for imp, attrs in impressions]
-        self._counter.track([imp for imp, _ in imps if imp.previous_time != None])
+        test_and_set = self._observer.test_and_set
+        imps = [(test_and_set(imp), attrs) for imp, attrs in impressions]
         this_hour = truncate_time(utctime_ms())
-        return [i for i, _ in imps if i.previous_time is None or i.previous_time < this_hour], imps
+        # split observed impressions into the ones to count & the ones to log in a single pass
+        to_count = []
+        to_log = []
+        for imp, _ in imps:
+            previous_time = imp.previous_time
+            if previous_time is None:
+                to_log.append(imp)
+                continue
+            to_count.append(imp)
+            if previous_time < this_hour:
+                to_log.append(imp)
+        self._counter.track(to_count)
+        return to_log, imps
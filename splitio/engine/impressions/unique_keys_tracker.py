@@ -45,11 +45,14 @@ class UniqueKeysTracker(BaseUniqueKeysTracker):
         :return: True if successful
         :rtype: boolean
         """
+        filter_key = feature_flag_name + key
         with self._lock:
-            if self._filter.contains(feature_flag_name+key):
+            keys = self._cache.get(feature_flag_name)
+            # keys pending to be sent are checked first, skipping the (slower) filter lookup
+            if (keys is not None and key in keys) or self._filter.contains(filter_key):
                 return False
             self._add_or_update(feature_flag_name, key)
-            self._filter.add(feature_flag_name+key)
+            self._filter.add(filter_key)
             self._current_cache_size += 1
 
         if self._current_cache_size > self._cache_size:
@@ -90,6 +90,7 @@ class Split(object):  # pylint: disable=too-many-instance-attributes
             self._algo = HashAlgorithm.LEGACY
 
         self._configurations = configurations
+        self._segment_names = None
 
     @property
     def name(self):
@@ -154,10 +155,15 @@ class Split(object):  # pylint: disable=too-many-instance-attributes
         """
         Return a list of segment names referenced in all matchers from this split.
 
+        Conditions never change once the split is built, so the list is computed
+        only once. It must not be modified by callers.
+
         :return: List of segment names.
         :rtype: list(string)
         """
-        return [name for cond in self.conditions for name in cond.get_segment_names()]
+        if self._segment_names is None:
+            self._segment_names = [name for cond in self.conditions for name in cond.get_segment_names()]
+        return self._segment_names
 
     def to_json(self):
         """Return a JSON representation of this split."""
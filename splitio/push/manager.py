@@ -4,7 +4,7 @@ import logging
 from threading import Timer
 
 from splitio.api import APIException
-from splitio.util.time import get_current_epoch_time_ms
+from splitio.util.time import get_current_epoch_time_ms, get_current_monotonic_ms
 from splitio.push.splitsse import SplitSSEClient
 from splitio.push.parser import parse_incoming_event, EventParsingException, EventType, \
     MessageType
@@ -62,6 +62,8 @@ class PushManager(object):  # pylint:disable=too-many-instance-attributes
                                           self._handle_connection_end, client_key, **kwargs)
         self._running = False
         self._next_refresh = Timer(0, lambda: 0)
+        self._token = None
+        self._token_fetched_ms = None  # monotonic time at which the current token was first received
         self._telemetry_runtime_producer = telemetry_runtime_producer
 
 
@@ -146,26 +148,36 @@ class PushManager(object):  # pylint:disable=too-many-instance-attributes
         if not token.push_enabled:
             self._feedback_loop.put(Status.PUSH_NONRETRYABLE_ERROR)
             return
-        self._telemetry_runtime_producer.record_token_refreshes()
+
+        if token is self._token:  # cached token reused by the auth api
+            token_age = (get_current_monotonic_ms() - self._token_fetched_ms) / 1000
+        else:
+            self._token = token
+            self._token_fetched_ms = get_current_monotonic_ms()
+            token_age = 0
+            self._telemetry_runtime_producer.record_token_refreshes()
         _LOGGER.debug("auth token fetched. connecting to streaming.")
 
         self._status_tracker.reset()
         if self._sse_client.start(token):
             _LOGGER.debug("connected to streaming, scheduling next refresh")
-            self._setup_next_token_refresh(token)
+            self._setup_next_token_refresh(token, token_age)
             self._running = True
             self._telemetry_runtime_producer.record_streaming_event((StreamingEventTypes.CONNECTION_ESTABLISHED, 0,  get_current_epoch_time_ms()))
 
-    def _setup_next_token_refresh(self, token):
+    def _setup_next_token_refresh(self, token, token_age=0):
         """
         Schedule next token refresh.
 
         :param token: Last fetched token.
         :type token: splitio.models.token.Token
+
+        :param token_age: Seconds elapsed since the token was fetched.
+        :type token_age: float
         """
         if self._next_refresh is not None:
             self._next_refresh.cancel()
-        self._next_refresh = Timer((token.exp - token.iat) - _TOKEN_REFRESH_GRACE_PERIOD,
+        self._next_refresh = Timer((token.exp - token.iat) - token_age - _TOKEN_REFRESH_GRACE_PERIOD,
                                    self._token_refresh)
         self._next_refresh.setName('TokenRefresh')
         self._next_refresh.start()
@@ -229,6 +241,8 @@ class PushManager(object):  # pylint:disable=too-many-instance-attributes
         :type event: splitio.push.sse.parser.AblyError
         """
         _LOGGER.debug('handling ably error event: %s', str(event))
+        if event.is_retryable():  # token related errors, don't reuse the cached token
+            self._auth_api.invalidate()
         feedback = self._status_tracker.handle_ably_error(event)
         if feedback is not None:
             self._feedback_loop.put(feedback)
@@ -52,6 +52,26 @@ class SplitStorage(object, metaclass=abc.ABCMeta):
         """
         pass
 
+    def put_many(self, splits):
+        """
+        Store multiple splits.
+
+        :param splits: Split objects to store.
+        :type splits: list(splitio.models.splits.Split)
+        """
+        for split in splits:
+            self.put(split)
+
+    def remove_many(self, split_names):
+        """
+        Remove multiple splits from storage.
+
+        :param split_names: Names of the features to remove.
+        :type split_names: list(str)
+        """
+        for split_name in split_names:
+            self.remove(split_name)
+
     @abc.abstractmethod
     def get_change_number(self):
         """
@@ -56,10 +56,30 @@ class InMemorySplitStorage(SplitStorage):
         :type split: splitio.models.split.Split
         """
         with self._lock:
-            if split.name in self._splits:
-                self._decrease_traffic_type_count(self._splits[split.name].traffic_type_name)
-            self._splits[split.name] = split
-            self._increase_traffic_type_count(split.traffic_type_name)
+            self._put(split)
+
+    def put_many(self, splits):
+        """
+        Store multiple splits acquiring the lock only once.
+
+        :param splits: Split objects to store.
+        :type splits: list(splitio.models.splits.Split)
+        """
+        with self._lock:
+            for split in splits:
+                self._put(split)
+
+    def _put(self, split):
+        """
+        Store a split. Must be called with the lock held.
+
+        :param split: Split object.
+        :type split: splitio.models.split.Split
+        """
+        if split.name in self._splits:
+            self._decrease_traffic_type_count(self._splits[split.name].traffic_type_name)
+        self._splits[split.name] = split
+        self._increase_traffic_type_count(split.traffic_type_name)
 
     def remove(self, split_name):
         """
@@ -72,14 +92,37 @@ class InMemorySplitStorage(SplitStorage):
         :rtype: bool
         """
         with self._lock:
-            split = self._splits.get(split_name)
-            if not split:
-                _LOGGER.warning("Tried to delete nonexistant split %s. Skipping", split_name)
-                return False
+            return self._remove(split_name)
 
-            self._splits.pop(split_name)
-            self._decrease_traffic_type_count(split.traffic_type_name)
-            return True
+    def remove_many(self, split_names):
+        """
+        Remove multiple splits from storage acquiring the lock only once.
+
+        :param split_names: Names of the features to remove.
+        :type split_names: list(str)
+        """
+        with self._lock:
+            for split_name in split_names:
+                self._remove(split_name)
+
+    def _remove(self, split_name):
+        """
+        Remove a split from storage. Must be called with the lock held.
+
+        :param split_name: Name of the feature to remove.
+        :type split_name: str
+
+        :return: True if the split was found and removed. False otherwise.
+        :rtype: bool
+        """
+        split = self._splits.get(split_name)
+        if not split:
+            _LOGGER.warning("Tried to delete nonexistant split %s. Skipping", split_name)
+            return False
+
+        self._splits.pop(split_name)
+        self._decrease_traffic_type_count(split.traffic_type_name)
+        return True
 
     def get_change_number(self):
         """
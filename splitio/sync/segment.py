@@ -40,7 +40,8 @@ class SegmentSynchronizer(object):
         self._worker_pool.start()
         self._backoff = Backoff(
                                 _ON_DEMAND_FETCH_BACKOFF_BASE,
-                                _ON_DEMAND_FETCH_BACKOFF_MAX_WAIT)
+                                _ON_DEMAND_FETCH_BACKOFF_MAX_WAIT,
+                                jitter=True)
 
     def recreate(self):
         """
@@ -255,7 +256,7 @@ class LocalSegmentSynchronizer(object):
         """
         try:
             fetched = self._read_segment_from_json_file(segment_name)
-            fetched_sha = util._get_sha(json.dumps(fetched))
+            fetched_sha = util._get_hash(json.dumps(fetched))
             if not self.segment_exist_in_storage(segment_name):
                     self._segment_sha[segment_name] = fetched_sha
                     self._segment_storage.put(segments.from_raw(fetched))
@@ -1,11 +1,11 @@
 """Splits synchronization logic."""
+import copy
 import logging
+import os
 import re
-import itertools
 import yaml
 import time
-import json
-import hashlib
+from collections import defaultdict
 from enum import Enum
 
 from splitio.api import APIException
@@ -13,19 +13,103 @@ from splitio.api.commons import FetchOptions
 from splitio.models import splits
 from splitio.util.backoff import Backoff
 from splitio.util.time import get_current_epoch_time_ms
+from splitio.util import jsonutil
 from splitio.sync import util
 
-_LEGACY_COMMENT_LINE_RE = re.compile(r'^#.*$')
-_LEGACY_DEFINITION_LINE_RE = re.compile(r'^(?<![^#])(?P<feature>[\w_-]+)\s+(?P<treatment>[\w_-]+)$')
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YAMLLoader
+
+# Matches blank lines, comments and feature flag definitions. Only definitions capture a feature.
+_LEGACY_LINE_RE = re.compile(r'^\s*(?:#.*|(?P<feature>[\w-]+)\s+(?P<treatment>[\w-]+))?\s*$')
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
+_ACTIVE_STATUS = splits.Status.ACTIVE.value
+_VALID_STATUSES = tuple(status.value for status in splits.Status)
+
+
+def _get_current_epoch_time_seconds():
+    """Return the current epoch time in seconds, used as lazily computed default seed."""
+    return int(get_current_epoch_time_ms() / 1000)
+
+
+# element name, default value, lower value, upper value, in list & not in list
+_FEATURE_FLAG_SANITIZATION_SPEC = (
+    ('trafficTypeName', 'user', None, None, None, None),
+    ('trafficAllocation', 100, 0, 100,  None, None),
+    ('trafficAllocationSeed', _get_current_epoch_time_seconds, None, None, None, [0]),
+    ('seed', _get_current_epoch_time_seconds, None, None, None, [0]),
+    ('status', _ACTIVE_STATUS, None, None, _VALID_STATUSES, None),
+    ('killed', False, None, None, None, None),
+    ('defaultTreatment', 'control', None, None, None, ['', ' ']),
+    ('changeNumber', 0, 0, None, None, None),
+    ('algo', 2, 2, 2, None, None)
+)
+
+
+# Templates used to build localhost feature flags. They're shallow-copied and patched,
+# so they must never be mutated.
+_LOCALHOST_FEATURE_FLAG_TEMPLATE = {
+    'changeNumber': 123,
+    'trafficTypeName': 'user',
+    'trafficAllocation': 100,
+    'trafficAllocationSeed': 123456,
+    'seed': 321654,
+    'status': 'ACTIVE',
+    'killed': False,
+    'defaultTreatment': 'control',
+    'algo': 2,
+}
+_LOCALHOST_CONDITION_TEMPLATE = {
+    'conditionType': 'WHITELIST',
+    'label': 'some_other_label',
+}
+_LOCALHOST_ALL_KEYS_MATCHER_GROUP = {
+    'matchers': [
+        {
+            'matcherType': 'ALL_KEYS',
+            'negate': False,
+        }
+    ],
+    'combiner': 'AND'
+}
+# Default rule appended to JSON feature flags whose last condition doesn't match all keys.
+_DEFAULT_ROLLOUT_CONDITION = {
+    'conditionType': 'ROLLOUT',
+    'matcherGroup': {
+        'combiner': 'AND',
+        'matchers': [{
+            'keySelector': {'trafficType': 'user', 'attribute': None},
+            'matcherType': 'ALL_KEYS',
+            'negate': False,
+            'userDefinedSegmentMatcherData': None,
+            'whitelistMatcherData': None,
+            'unaryNumericMatcherData': None,
+            'betweenMatcherData': None,
+            'booleanMatcherData': None,
+            'dependencyMatcherData': None,
+            'stringMatcherData': None
+        }]
+    },
+    'partitions': [
+        {'treatment': 'on', 'size': 0},
+        {'treatment': 'off', 'size': 100}
+    ],
+    'label': 'default rule'
+}
+
 _ON_DEMAND_FETCH_BACKOFF_BASE = 10  # backoff base starting at 10 seconds
 _ON_DEMAND_FETCH_BACKOFF_MAX_WAIT = 30  # don't sleep for more than 30 seconds
 _ON_DEMAND_FETCH_BACKOFF_MAX_RETRIES = 10
 
+# A file modified this recently could be rewritten again within the same mtime tick,
+# so its stat can't be trusted to detect changes.
+_RACY_STAT_WINDOW_NS = 2 * 1000000000  # 2 seconds
+
 
 class SplitSynchronizer(object):
     """Feature Flag changes synchronizer."""
@@ -44,7 +128,8 @@ class SplitSynchronizer(object):
         self._feature_flag_storage = feature_flag_storage
         self._backoff = Backoff(
                                 _ON_DEMAND_FETCH_BACKOFF_BASE,
-                                _ON_DEMAND_FETCH_BACKOFF_MAX_WAIT)
+                                _ON_DEMAND_FETCH_BACKOFF_MAX_WAIT,
+                                jitter=True)
 
     @property
     def feature_flag_storage(self):
@@ -80,13 +165,19 @@ class SplitSynchronizer(object):
                 _LOGGER.debug('Exception information: ', exc_info=True)
                 raise exc
 
+            to_add = []
+            to_remove = []
             for feature_flag in feature_flag_changes.get('splits', []):
-                if feature_flag['status'] == splits.Status.ACTIVE.value:
+                if feature_flag['status'] == _ACTIVE_STATUS:
                     parsed = splits.from_raw(feature_flag)
-                    self._feature_flag_storage.put(parsed)
-                    segment_list.update(set(parsed.get_segment_names()))
+                    to_add.append(parsed)
+                    segment_list.update(parsed.get_segment_names())
                 else:
-                    self._feature_flag_storage.remove(feature_flag['name'])
+                    to_remove.append(feature_flag['name'])
+            if to_add:
+                self._feature_flag_storage.put_many(to_add)
+            if to_remove:
+                self._feature_flag_storage.remove_many(to_remove)
             self._feature_flag_storage.set_change_number(feature_flag_changes['till'])
             if feature_flag_changes['till'] == feature_flag_changes['since']:
                 return feature_flag_changes['till'], segment_list
@@ -110,7 +201,7 @@ class SplitSynchronizer(object):
         while True:
             remaining_attempts -= 1
             change_number, segment_list = self._fetch_until(fetch_options, till)
-            final_segment_list.update(segment_list)
+            final_segment_list |= segment_list
             if till is None or till <= change_number:
                 return True, remaining_attempts, change_number, final_segment_list
             elif remaining_attempts <= 0:
@@ -125,18 +216,16 @@ class SplitSynchronizer(object):
         :param till: Passed till from Streaming.
         :type till: int
         """
-        final_segment_list = set()
         fetch_options = FetchOptions(True)  # Set Cache-Control to no-cache
-        successful_sync, remaining_attempts, change_number, segment_list = self._attempt_feature_flag_sync(fetch_options,
+        successful_sync, remaining_attempts, change_number, final_segment_list = self._attempt_feature_flag_sync(fetch_options,
                                                                                       till)
-        final_segment_list.update(segment_list)
         attempts = _ON_DEMAND_FETCH_BACKOFF_MAX_RETRIES - remaining_attempts
         if successful_sync:  # succedeed sync
             _LOGGER.debug('Refresh completed in %d attempts.', attempts)
             return final_segment_list
         with_cdn_bypass = FetchOptions(True, change_number)  # Set flag for bypassing CDN
         without_cdn_successful_sync, remaining_attempts, change_number, segment_list = self._attempt_feature_flag_sync(with_cdn_bypass, till)
-        final_segment_list.update(segment_list)
+        final_segment_list |= segment_list
         without_cdn_attempts = _ON_DEMAND_FETCH_BACKOFF_MAX_RETRIES - remaining_attempts
         if without_cdn_successful_sync:
             _LOGGER.debug('Refresh completed bypassing the CDN in %d attempts.',
@@ -184,7 +273,8 @@ class LocalSplitSynchronizer(object):
         self._filename = filename
         self._feature_flag_storage = feature_flag_storage
         self._localhost_mode = localhost_mode
-        self._current_json_sha = "-1"
+        self._current_json_hash = None
+        self._current_json_stat = None
 
     @staticmethod
     def _make_feature_flag(feature_flag_name, conditions, configs=None):
@@ -195,16 +285,8 @@ class LocalSplitSynchronizer(object):
         :type feature_flag_name: str.
         """
         return splits.from_raw({
-            'changeNumber': 123,
-            'trafficTypeName': 'user',
+            **_LOCALHOST_FEATURE_FLAG_TEMPLATE,
             'name': feature_flag_name,
-            'trafficAllocation': 100,
-            'trafficAllocationSeed': 123456,
-            'seed': 321654,
-            'status': 'ACTIVE',
-            'killed': False,
-            'defaultTreatment': 'control',
-            'algo': 2,
             'conditions': conditions,
             'configurations': configs
         })
@@ -212,30 +294,20 @@ class LocalSplitSynchronizer(object):
     @staticmethod
     def _make_all_keys_condition(treatment):
         return {
+            **_LOCALHOST_CONDITION_TEMPLATE,
             'partitions': [
                 {'treatment': treatment, 'size': 100}
             ],
-            'conditionType': 'WHITELIST',
-            'label': 'some_other_label',
-            'matcherGroup': {
-                'matchers': [
-                    {
-                        'matcherType': 'ALL_KEYS',
-                        'negate': False,
-                    }
-                ],
-                'combiner': 'AND'
-            }
+            'matcherGroup': _LOCALHOST_ALL_KEYS_MATCHER_GROUP
         }
 
     @staticmethod
     def _make_whitelist_condition(whitelist, treatment):
         return {
+            **_LOCALHOST_CONDITION_TEMPLATE,
             'partitions': [
                 {'treatment': treatment, 'size': 100}
             ],
-            'conditionType': 'WHITELIST',
-            'label': 'some_other_label',
             'matcherGroup': {
                 'matchers': [
                     {
@@ -265,11 +337,8 @@ class LocalSplitSynchronizer(object):
         try:
             with open(filename, 'r') as flo:
                 for line in flo:
-                    if line.strip() == '' or _LEGACY_COMMENT_LINE_RE.match(line):
-                        continue
-
-                    definition_match = _LEGACY_DEFINITION_LINE_RE.match(line)
-                    if not definition_match:
+                    line_match = _LEGACY_LINE_RE.match(line)
+                    if not line_match:
                         _LOGGER.warning(
                             'Invalid line on localhost environment feature flag '
                             'definition. Line = %s',
@@ -277,8 +346,11 @@ class LocalSplitSynchronizer(object):
                         )
                         continue
 
-                    cond = cls._make_all_keys_condition(definition_match.group('treatment'))
-                    splt = cls._make_feature_flag(definition_match.group('feature'), [cond])
+                    if line_match.group('feature') is None:  # blank line or comment
+                        continue
+
+                    cond = cls._make_all_keys_condition(line_match.group('treatment'))
+                    splt = cls._make_feature_flag(line_match.group('feature'), [cond])
                     to_return[splt.name] = splt
             return to_return
 
@@ -298,14 +370,14 @@ class LocalSplitSynchronizer(object):
         """
         try:
             with open(filename, 'r') as flo:
-                parsed = yaml.load(flo.read(), Loader=yaml.FullLoader)
+                parsed = yaml.load(flo, Loader=_YAMLLoader)
 
-            grouped_by_feature_name = itertools.groupby(
-                sorted(parsed, key=lambda i: next(iter(i.keys()))),
-                lambda i: next(iter(i.keys())))
+            grouped_by_feature_name = defaultdict(list)
+            for statement in parsed:
+                grouped_by_feature_name[next(iter(statement))].append(statement)
 
             to_return = {}
-            for (feature_flag_name, statements) in grouped_by_feature_name:
+            for (feature_flag_name, statements) in grouped_by_feature_name.items():
                 configs = {}
                 whitelist = []
                 all_keys = []
@@ -346,7 +418,7 @@ class LocalSplitSynchronizer(object):
         else:
             fetched = self._read_feature_flags_from_legacy_file(self._filename)
         to_delete = [name for name in self._feature_flag_storage.get_split_names()
-                     if name not in fetched.keys()]
+                     if name not in fetched]
         for feature_flag in fetched.values():
             self._feature_flag_storage.put(feature_flag)
 
@@ -363,23 +435,31 @@ class LocalSplitSynchronizer(object):
         :rtype: [str]
         """
         try:
-            fetched, till = self._read_feature_flags_from_json_file(self._filename)
+            fetched, till, fetched_hash = self._read_feature_flags_from_json_file(self._filename)
             segment_list = set()
-            fecthed_sha = util._get_sha(json.dumps(fetched))
-            if fecthed_sha == self._current_json_sha:
+            if fetched_hash == self._current_json_hash:
                 return []
-            self._current_json_sha = fecthed_sha
+            self._current_json_hash = fetched_hash
             if self._feature_flag_storage.get_change_number() > till and till != self._DEFAULT_FEATURE_FLAG_TILL:
                 return []
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
+            to_add = []
+            to_remove = []
             for feature_flag in fetched:
-                if feature_flag['status'] == splits.Status.ACTIVE.value:
+                if feature_flag['status'] == _ACTIVE_STATUS:
                     parsed = splits.from_raw(feature_flag)
-                    self._feature_flag_storage.put(parsed)
-                    _LOGGER.debug("feature flag %s is updated", parsed.name)
-                    segment_list.update(set(parsed.get_segment_names()))
+                    to_add.append(parsed)
+                    if debug:
+                        _LOGGER.debug("feature flag %s is updated", parsed.name)
+                    segment_list.update(parsed.get_segment_names())
                 else:
-                    self._feature_flag_storage.remove(feature_flag['name'])
+                    to_remove.append(feature_flag['name'])
 
+            if to_add:
+                self._feature_flag_storage.put_many(to_add)
+            if to_remove:
+                self._feature_flag_storage.remove_many(to_remove)
+            if fetched:
                 self._feature_flag_storage.set_change_number(till)
             return segment_list
         except Exception as exc:
@@ -389,17 +469,33 @@ class LocalSplitSynchronizer(object):
         """
         Parse a feature flags file and return a populated storage.
 
+        The file is only parsed when its contents changed since the last read, otherwise
+        feature flags and till are returned as None along with the current hash.
+
         :param filename: Path of the file containing feature flags
         :type filename: str.
 
-        :return: Tuple: sanitized feature flag structure dict and till
-        :rtype: Tuple(Dict, int)
+        :return: Tuple: sanitized feature flag structure dict, till and hash of the file contents
+        :rtype: Tuple(Dict, int, str)
         """
         try:
-            with open(filename, 'r') as flo:
-                parsed = json.load(flo)
-            santitized = self._sanitize_feature_flag(parsed)
-            return santitized['splits'], santitized['till']
+            file_stat = os.stat(filename)
+            file_stat = (file_stat.st_mtime_ns, file_stat.st_size)
+            if file_stat == self._current_json_stat:
+                return None, None, self._current_json_hash
+
+            with open(filename, 'rb') as flo:
+                raw = flo.read()
+            racy = int(time.time() * 1e9) - file_stat[0] < _RACY_STAT_WINDOW_NS
+            fetched_hash = util._get_hash(raw)
+            if fetched_hash == self._current_json_hash:
+                self._current_json_stat = None if racy else file_stat
+                return None, None, fetched_hash
+
+            sanitized = self._sanitize_feature_flag(jsonutil.loads(raw))
+            # only trust the stat once the contents parsed, so malformed files keep failing
+            self._current_json_stat = None if racy else file_stat
+            return sanitized['splits'], sanitized['till'], fetched_hash
         except Exception as exc:
             _LOGGER.error(str(exc))
             raise ValueError("Error parsing file %s. Make sure it's readable." % filename) from exc
@@ -453,15 +549,7 @@ class LocalSplitSynchronizer(object):
             if 'name' not in feature_flag or feature_flag['name'].strip() == '':
                 _LOGGER.warning("A feature flag in json file does not have (Name) or property is empty, skipping.")
                 continue
-            for element in [('trafficTypeName', 'user', None, None, None, None),
-                            ('trafficAllocation', 100, 0, 100,  None, None),
-                            ('trafficAllocationSeed', int(get_current_epoch_time_ms() / 1000), None, None, None, [0]),
-                            ('seed', int(get_current_epoch_time_ms() / 1000), None, None, None, [0]),
-                            ('status', splits.Status.ACTIVE.value, None, None, [e.value for e in splits.Status], None),
-                            ('killed', False, None, None, None, None),
-                            ('defaultTreatment', 'control', None, None, None, ['', ' ']),
-                            ('changeNumber', 0, 0, None, None, None),
-                            ('algo', 2, 2, 2, None, None)]:
+            for element in _FEATURE_FLAG_SANITIZATION_SPEC:
                 feature_flag = util._sanitize_object_element(feature_flag, 'split', element[0], element[1], lower_value=element[2], upper_value=element[3], in_list=element[4], not_in_list=element[5])
             feature_flag = self._sanitize_condition(feature_flag)
             sanitized_feature_flags.append(feature_flag)
@@ -477,44 +565,14 @@ class LocalSplitSynchronizer(object):
         :return: sanitized feature flag
         :rtype: Dict
         """
-        found_all_keys_matcher = False
         feature_flag['conditions'] = feature_flag.get('conditions', [])
-        if len(feature_flag['conditions']) > 0:
-            last_condition = feature_flag['conditions'][-1]
-            if 'conditionType' in last_condition:
-                if last_condition['conditionType'] == 'ROLLOUT':
-                    if 'matcherGroup' in last_condition:
-                        if 'matchers' in last_condition['matcherGroup']:
-                            for matcher in last_condition['matcherGroup']['matchers']:
-                                if matcher['matcherType'] == 'ALL_KEYS':
-                                    found_all_keys_matcher = True
-                                    break
+        last_condition = feature_flag['conditions'][-1] if feature_flag['conditions'] else {}
+        found_all_keys_matcher = last_condition.get('conditionType') == 'ROLLOUT' and any(
+            matcher['matcherType'] == 'ALL_KEYS'
+            for matcher in last_condition.get('matcherGroup', {}).get('matchers', []))
 
         if not found_all_keys_matcher:
             _LOGGER.debug("Missing default rule condition for feature flag: %s, adding default rule with 100%% off treatment", feature_flag['name'])
-            feature_flag['conditions'].append(
-            {
-                "conditionType": "ROLLOUT",
-                "matcherGroup": {
-                "combiner": "AND",
-                "matchers": [{
-                    "keySelector": { "trafficType": "user", "attribute": None },
-                    "matcherType": "ALL_KEYS",
-                    "negate": False,
-                    "userDefinedSegmentMatcherData": None,
-                    "whitelistMatcherData": None,
-                    "unaryNumericMatcherData": None,
-                    "betweenMatcherData": None,
-                    "booleanMatcherData": None,
-                    "dependencyMatcherData": None,
-                    "stringMatcherData": None
-                    }]
-                },
-                "partitions": [
-                    { "treatment": "on", "size": 0 },
-                    { "treatment": "off", "size": 100 }
-                ],
-            "label": "default rule"
-        })
+            feature_flag['conditions'].append(copy.deepcopy(_DEFAULT_ROLLOUT_CONDITION))
 
         return feature_flag
\ No newline at end of file
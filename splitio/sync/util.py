@@ -3,17 +3,31 @@ import logging
 
 _LOGGER = logging.getLogger(__name__)
 
-def _get_sha(fetched):
+def _get_hash(fetched):
     """
-    Return sha256 of given string.
+    Return a hash of given string, used to detect changes in its contents.
 
     :param fetched: string variable
-    :type fetched: str
+    :type fetched: str|bytes
 
-    :return: hex representation of sha256
+    :return: hex representation of the 128 bits blake2b hash
     :rtype: str
     """
-    return hashlib.sha256(fetched.encode()).hexdigest()
+    if isinstance(fetched, str):
+        fetched = fetched.encode()
+    return hashlib.blake2b(fetched, digest_size=16).hexdigest()
+
+def _get_default(default_value):
+    """
+    Return the default value, computing it when it's lazily evaluated.
+
+    :param default_value: default value or callable returning it
+    :type default_value: any
+
+    :return: default value
+    :rtype: any
+    """
+    return default_value() if callable(default_value) else default_value
 
 def _sanitize_object_element(object, object_name, element_name, default_value, lower_value=None, upper_value=None, in_list=None, not_in_list=None):
     """
@@ -23,7 +37,7 @@ def _sanitize_object_element(object, object_name, element_name, default_value, l
     :type object: Dict
     :param element_name: element name
     :type element_name: str
-    :param default_value: element default value
+    :param default_value: element default value, or a callable returning it
     :type default_value: any
     :param lower_value: Optional, element lower value limit
     :type lower_value: any
@@ -37,28 +51,13 @@ def _sanitize_object_element(object, object_name, element_name, default_value, l
     :return: sanitized object
     :rtype: Dict
     """
-    if element_name not in object or object[element_name] is None:
-            object[element_name] = default_value
-            _LOGGER.debug("Sanitized element [%s] to '%s' in %s: %s.", element_name, default_value, object_name, object['name'])
-    if lower_value is not None and upper_value is not None:
-        if object[element_name] < lower_value or object[element_name] > upper_value:
-            object[element_name] = default_value
-            _LOGGER.debug("Sanitized element [%s] to '%s' in %s: %s.", element_name, default_value, object_name, object['name'])
-    elif lower_value is not None:
-        if object[element_name] < lower_value:
-            object[element_name] = default_value
-            _LOGGER.debug("Sanitized element [%s] to '%s' in %s: %s.", element_name, default_value, object_name, object['name'])
-    elif upper_value is not None:
-        if object[element_name] > upper_value:
-            object[element_name] = default_value
-            _LOGGER.debug("Sanitized element [%s] to '%s' in %s: %s.", element_name, default_value, object_name, object['name'])
-    if in_list is not None:
-        if object[element_name] not in in_list:
-            object[element_name] = default_value
-            _LOGGER.debug("Sanitized element [%s] to '%s' in %s: %s.", element_name, default_value, object_name, object['name'])
-    if not_in_list is not None:
-        if object[element_name] in not_in_list:
-            object[element_name] = default_value
-            _LOGGER.debug("Sanitized element [%s] to '%s' in %s: %s.", element_name, default_value, object_name, object['name'])
+    value = object.get(element_name)
+    if value is None \
+            or (lower_value is not None and value < lower_value) \
+            or (upper_value is not None and value > upper_value) \
+            or (in_list is not None and value not in in_list) \
+            or (not_in_list is not None and value in not_in_list):
+        object[element_name] = _get_default(default_value)
+        _LOGGER.debug("Sanitized element [%s] to '%s' in %s: %s.", element_name, object[element_name], object_name, object['name'])
 
     return object
@@ -1,4 +1,5 @@
 """Exponential Backoff duration calculator."""
+import random
 
 
 class Backoff(object):
@@ -6,7 +7,7 @@ class Backoff(object):
 
     MAX_ALLOWED_WAIT = 30 * 60  # half an hour
 
-    def __init__(self, base=1, max_allowed=MAX_ALLOWED_WAIT):
+    def __init__(self, base=1, max_allowed=MAX_ALLOWED_WAIT, jitter=False):
         """
         Class constructor.
 
@@ -15,10 +16,14 @@ class Backoff(object):
 
         :param max_allowed: max seconds to wait
         :param max_allowed: int
+
+        :param jitter: whether to pick a random wait between 0 and the exponential value
+        :param jitter: bool
         """
         self._base = base
         self._max_allowed = max_allowed
         self._attempt = 0
+        self._random = random.Random() if jitter else None
 
     def get(self):
         """
@@ -29,6 +34,8 @@ class Backoff(object):
         """
         to_return = min(self._base * (2 ** self._attempt), self._max_allowed)
         self._attempt += 1
+        if self._random is not None:
+            return self._random.uniform(0, to_return)
         return to_return
 
     def reset(self):
@@ -0,0 +1,37 @@
+"""
+JSON utilities.
+
+Decoding uses orjson (if installed), falling back to the standard library otherwise.
+"""
+
+try:
+    # First attempt to import the module with rust core (faster)
+    import orjson
+
+    def loads(raw):
+        """
+        Decode a json document.
+
+        :param raw: json document
+        :type raw: str|bytes
+
+        :return: decoded object
+        :rtype: any
+        """
+        return orjson.loads(raw)
+
+except ImportError:
+    # Fallback to the standard library decoder (slower)
+    import json
+
+    def loads(raw):
+        """
+        Decode a json document.
+
+        :param raw: json document
+        :type raw: str|bytes
+
+        :return: decoded object
+        :rtype: any
+        """
+        return json.loads(raw)
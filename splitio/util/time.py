@@ -1,17 +1,14 @@
 """Utilities."""
-from datetime import datetime
 import time
 
-EPOCH_DATETIME = datetime(1970, 1, 1)
-
 def utctime():
     """
-    Return the utc time in nanoseconds.
+    Return the utc time in seconds.
 
-    :returns: utc time in nanoseconds.
+    :returns: utc time in seconds.
     :rtype: float
     """
-    return (datetime.utcnow() - EPOCH_DATETIME).total_seconds()
+    return time.time()
 
 
 def utctime_ms():
@@ -21,7 +18,7 @@ def utctime_ms():
     :returns: utc time in milliseconds.
     :rtype: int
     """
-    return int(utctime() * 1000)
+    return int(time.time() * 1000)
 
 def get_current_epoch_time_ms():
     """
@@ -30,4 +27,17 @@ def get_current_epoch_time_ms():
     :return: epoch time
     :rtype: int
     """
-    return int(round(time.time() * 1000))
\ No newline at end of file
+    return int(round(time.time() * 1000))
+
+
+def get_current_monotonic_ms():
+    """
+    Get current value of a monotonic clock in milliseconds.
+
+    Only meaningful to measure elapsed time, since it isn't tied to the epoch
+    and won't jump if the system clock is adjusted.
+
+    :return: monotonic time
+    :rtype: int
+    """
+    return int(time.monotonic() * 1000)
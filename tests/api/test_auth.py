@@ -1,5 +1,8 @@
 """Split API tests module."""
 
+import base64
+import json
+import time
 import pytest
 
 import unittest.mock as mock
@@ -50,6 +53,7 @@ class AuthAPITests(object):
         def raise_exception(*args, **kwargs):
             raise client.HttpClientException('some_message')
         httpclient.get.side_effect = raise_exception
+        auth_api.invalidate()
         with pytest.raises(APIException) as exc_info:
             response = auth_api.authenticate()
             assert exc_info.type == APIException
@@ -74,3 +78,36 @@ class AuthAPITests(object):
         except:
             pass
         assert(mocker.called)
+
+    def test_auth_token_cache(self, mocker):
+        """Test a valid token is reused until it's invalidated."""
+        claims = {
+            'x-ably-capability': '{"control_pri":["subscribe"]}',
+            'exp': int(time.time()) + 3600,
+            'iat': int(time.time())
+        }
+        token = 'header.%s.signature' % base64.b64encode(json.dumps(claims).encode()).decode().rstrip('=')
+        httpclient = mocker.Mock(spec=client.HttpClient)
+        httpclient.get.return_value = client.HttpResponse(200, json.dumps({'pushEnabled': True, 'token': token}))
+        telemetry_storage = InMemoryTelemetryStorage()
+        telemetry_producer = TelemetryStorageProducer(telemetry_storage)
+        telemetry_runtime_producer = telemetry_producer.get_telemetry_runtime_producer()
+        auth_api = auth.AuthAPI(httpclient, 'some_api_key', get_metadata(DEFAULT_CONFIG.copy()), telemetry_runtime_producer)
+        clock = mocker.patch('splitio.api.auth.get_current_monotonic_ms', return_value=1000)
+
+        first = auth_api.authenticate()
+        assert first.token == token
+        assert auth_api.authenticate() is first
+        assert len(httpclient.get.mock_calls) == 1
+
+        auth_api.invalidate()
+        assert auth_api.authenticate() is not first
+        assert len(httpclient.get.mock_calls) == 2
+
+        # tokens about to expire are not reused, regardless of the local wall clock
+        clock.return_value = 1000 + (3600 - auth._REFRESH_SKEW - 1) * 1000
+        auth_api.authenticate()
+        assert len(httpclient.get.mock_calls) == 2
+        clock.return_value = 1000 + (3600 - auth._REFRESH_SKEW) * 1000
+        auth_api.authenticate()
+        assert len(httpclient.get.mock_calls) == 3
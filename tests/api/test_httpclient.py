@@ -1,4 +1,8 @@
 """HTTPClient test module."""
+from threading import Thread
+
+import requests
+from requests.cookies import MockRequest, create_cookie
 
 from splitio.api import client
 
@@ -10,9 +14,10 @@ class HttpClientTests(object):
         response_mock = mocker.Mock()
         response_mock.status_code = 200
         response_mock.text = 'ok'
+        response_mock.headers = {'ETag': '"abc"'}
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.get', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.get', new=get_mock)
         httpclient = client.HttpClient()
         response = httpclient.get('sdk', '/test1', 'some_api_key', {'param1': 123}, {'h1': 'abc'})
         call = mocker.call(
@@ -23,6 +28,7 @@ class HttpClientTests(object):
         )
         assert response.status_code == 200
         assert response.body == 'ok'
+        assert response.headers == {'ETag': '"abc"'}
         assert get_mock.mock_calls == [call]
         get_mock.reset_mock()
 
@@ -44,7 +50,7 @@ class HttpClientTests(object):
         response_mock.text = 'ok'
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.get', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.get', new=get_mock)
         httpclient = client.HttpClient(sdk_url='https://sdk.com', events_url='https://events.com')
         response = httpclient.get('sdk', '/test1', 'some_api_key', {'param1': 123}, {'h1': 'abc'})
         call = mocker.call(
@@ -77,7 +83,7 @@ class HttpClientTests(object):
         response_mock.text = 'ok'
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.post', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.post', new=get_mock)
         httpclient = client.HttpClient()
         response = httpclient.post('sdk', '/test1', 'some_api_key', {'p1': 'a'}, {'param1': 123}, {'h1': 'abc'})
         call = mocker.call(
@@ -111,7 +117,7 @@ class HttpClientTests(object):
         response_mock.text = 'ok'
         get_mock = mocker.Mock()
         get_mock.return_value = response_mock
-        mocker.patch('splitio.api.client.requests.post', new=get_mock)
+        mocker.patch('splitio.api.client.requests.Session.post', new=get_mock)
         httpclient = client.HttpClient(sdk_url='https://sdk.com', events_url='https://events.com')
         response = httpclient.post('sdk', '/test1', 'some_api_key', {'p1': 'a'}, {'param1': 123}, {'h1': 'abc'})
         call = mocker.call(
@@ -137,3 +143,34 @@ class HttpClientTests(object):
         assert response.status_code == 200
         assert response.body == 'ok'
         assert get_mock.mock_calls == [call]
+
+    def test_session_reuse(self, mocker):
+        """Test the same pooled session is used across calls and rebuilt after a fork."""
+        httpclient = client.HttpClient()
+        session = httpclient._get_session()
+        assert httpclient._get_session() is session
+        assert session.get_adapter('https://sdk.split.io')._pool_maxsize == client._POOL_MAXSIZE
+
+        mocker.patch('splitio.api.client.os.getpid', return_value=-1)
+        assert httpclient._get_session() is not session
+
+    def test_session_concurrent_creation(self, mocker):
+        """Test threads racing on the first request share a single session."""
+        httpclient = client.HttpClient()
+        session_mock = mocker.Mock(wraps=requests.Session)
+        mocker.patch('splitio.api.client.requests.Session', new=session_mock)
+        sessions = []
+        threads = [Thread(target=lambda: sessions.append(httpclient._get_session())) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(session_mock.mock_calls) == 1
+        assert all(session is sessions[0] for session in sessions)
+
+    def test_session_rejects_cookies(self):
+        """Test the shared session doesn't carry cookies across requests."""
+        session = client.HttpClient()._get_session()
+        request = requests.Request('GET', 'https://sdk.split.io/api/splitChanges').prepare()
+        session.cookies.set_cookie_if_ok(create_cookie('some', 'cookie', domain='sdk.split.io'), MockRequest(request))
+        assert len(session.cookies) == 0
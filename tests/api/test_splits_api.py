@@ -73,3 +73,28 @@ class SplitAPITests(object):
 
         response = split_api.fetch_splits(123, FetchOptions())
         assert(mocker.called)
+
+    def test_fetch_split_changes_not_modified(self, mocker):
+        """Test that the last ETag is sent back and a 304 response is not parsed."""
+        httpclient = mocker.Mock(spec=client.HttpClient)
+        httpclient.get.return_value = client.HttpResponse(200, '{"splits": [], "since": 123, "till": 123}', {'ETag': '"abc"'})
+        split_api = splits.SplitsAPI(httpclient, 'some_api_key', SdkMetadata('1.0', 'some', '1.2.3.4'), mocker.Mock())
+
+        response = split_api.fetch_splits(123, FetchOptions())
+        assert response['till'] == 123
+        assert 'If-None-Match' not in httpclient.get.mock_calls[0][2]['extra_headers']
+
+        httpclient.reset_mock()
+        httpclient.get.return_value = client.HttpResponse(304, '')
+        response = split_api.fetch_splits(123, FetchOptions())
+        assert response == {'since': 123, 'till': 123, 'splits': []}
+        assert httpclient.get.mock_calls[0][2]['extra_headers']['If-None-Match'] == '"abc"'
+        assert 'If-None-Match' not in split_api._metadata
+
+        # the ETag is only sent for the same request it was returned for
+        httpclient.reset_mock()
+        httpclient.get.return_value = client.HttpResponse(200, '{"splits": [], "since": 124, "till": 124}')
+        split_api.fetch_splits(124, FetchOptions())
+        assert 'If-None-Match' not in httpclient.get.mock_calls[0][2]['extra_headers']
+        split_api.fetch_splits(123, FetchOptions(True, 130))
+        assert 'If-None-Match' not in httpclient.get.mock_calls[1][2]['extra_headers']
@@ -3,7 +3,7 @@
 import pytest
 import unittest.mock as mock
 
-from splitio.api.commons import headers_from_metadata, record_telemetry
+from splitio.api.commons import headers_from_metadata, record_telemetry, measured
 from splitio.client.util import SdkMetadata
 from splitio.engine.telemetry import TelemetryStorageProducer
 from splitio.storage.inmemmory import InMemoryTelemetryStorage
@@ -59,3 +59,23 @@ class UtilTests(object):
         record_telemetry(503, 300, HTTPExceptionsAndLatencies.SEGMENT, telemetry_runtime_producer)
         assert(telemetry_storage._http_sync_errors._segment['503'] == 1)
         assert(telemetry_storage._http_latencies._segment[0] == 2)
+
+    def test_measured(self, mocker):
+        """Test that measured requests record telemetry only when a status is set."""
+        telemetry_runtime_producer = mocker.Mock()
+
+        with measured(telemetry_runtime_producer, HTTPExceptionsAndLatencies.SPLIT) as measurement:
+            measurement.status = 200
+        assert telemetry_runtime_producer.record_sync_latency.mock_calls[0][1][0] == HTTPExceptionsAndLatencies.SPLIT
+        assert len(telemetry_runtime_producer.record_successful_sync.mock_calls) == 1
+
+        telemetry_runtime_producer.reset_mock()
+        with measured(telemetry_runtime_producer, HTTPExceptionsAndLatencies.SPLIT) as measurement:
+            measurement.status = 500
+        assert telemetry_runtime_producer.record_sync_error.mock_calls == [mocker.call(HTTPExceptionsAndLatencies.SPLIT, 500)]
+
+        telemetry_runtime_producer.reset_mock()
+        with pytest.raises(ValueError):
+            with measured(telemetry_runtime_producer, HTTPExceptionsAndLatencies.SPLIT) as measurement:
+                raise ValueError()
+        assert telemetry_runtime_producer.mock_calls == []
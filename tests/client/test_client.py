@@ -644,3 +644,15 @@ class ClientTests(object):  # pylint: disable=too-few-public-methods
         except:
             pass
         assert(telemetry_storage._method_exceptions._track == 1)
+
+    def test_build_impression_interns_names(self, mocker):
+        """Test that impressions share a single instance of each feature flag name."""
+        client = mocker.Mock(spec=Client)
+        client._labels_enabled = True
+        first = Client._build_impression(client, 'key', ''.join(['some_', 'feature']), 'on', 'l1', 123, None, 1000)
+        second = Client._build_impression(client, 'key', ''.join(['some_', 'feature']), 'on', 'l1', 123, None, 1000)
+        assert first == Impression('key', 'some_feature', 'on', 'l1', 123, None, 1000)
+        assert first.feature_name is second.feature_name
+
+        client._labels_enabled = False
+        assert Client._build_impression(client, 'key', None, 'control', 'l1', 123, None, 1000).label is None
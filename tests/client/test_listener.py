@@ -0,0 +1,28 @@
+"""Impression listener wrapper test module."""
+import pytest
+
+from splitio.client.listener import ImpressionListenerWrapper, ImpressionListenerException
+from splitio.client.util import SdkMetadata
+from splitio.models.impressions import Impression
+
+
+class ImpressionListenerWrapperTests(object):  # pylint: disable=too-few-public-methods
+    """Impression listener wrapper test cases."""
+
+    def test_log_impressions(self, mocker):
+        """Test that batches are forwarded one impression at a time until the listener fails."""
+        user_listener = mocker.Mock()
+        wrapper = ImpressionListenerWrapper(user_listener, SdkMetadata('1.0', 'some', '1.2.3.4'))
+        imp1 = Impression('k1', 'f1', 'on', 'l1', 123, None, 456)
+        imp2 = Impression('k2', 'f1', 'off', 'l1', 123, None, 456)
+        wrapper.log_impressions([(imp1, {'a': 1}), (imp2, None)])
+        assert user_listener.log_impression.mock_calls == [
+            mocker.call({'impression': imp1, 'attributes': {'a': 1}, 'sdk-language-version': '1.0', 'instance-id': 'some'}),
+            mocker.call({'impression': imp2, 'attributes': None, 'sdk-language-version': '1.0', 'instance-id': 'some'})
+        ]
+
+        user_listener.reset_mock()
+        user_listener.log_impression.side_effect = Exception('some')
+        with pytest.raises(ImpressionListenerException):
+            wrapper.log_impressions([(imp1, None), (imp2, None)])
+        assert len(user_listener.log_impression.mock_calls) == 1
@@ -81,6 +81,14 @@ class SplitFetchingTaskTests(object):
         assert isinstance(splits['split1'].conditions[0].matchers[0], AllKeysMatcher)
         assert isinstance(splits['split2'].conditions[0].matchers[0], AllKeysMatcher)
 
+    def test_parse_legacy_file_comments(self, tmp_path):
+        """Test that comments, blank & invalid lines are skipped in legacy files."""
+        filename = tmp_path / 'file.split'
+        filename.write_text('# comment\n\nsplit1 on\n  # indented comment\nsplit2 off  \ninvalid line here\nsplit3\n')
+        splits = LocalSplitSynchronizer._read_feature_flags_from_legacy_file(str(filename))
+        assert sorted(splits.keys()) == ['split1', 'split2']
+        assert splits['split2'].conditions[0].partitions[0].treatment == 'off'
+
     def test_parse_yaml_file(self):
         """Test that parsing a yaml file works."""
         filename = os.path.join(os.path.dirname(__file__), 'files', 'file2.yaml')
@@ -36,3 +36,14 @@ class SimpleLruCacheTests(object):
         assert cache.test_and_set('j', 0) is None
         assert len(cache._data) is 5
         assert set(cache._data.keys()) == set(['f', 'g', 'h', 'i', 'j'])
+
+    def test_hit_refreshes_recency(self, mocker):
+        """Test that hitting an entry marks it as most recently used."""
+        cache = SimpleLruCache(3)
+        assert cache.test_and_set('a', 1) is None
+        assert cache.test_and_set('b', 2) is None
+        assert cache.test_and_set('c', 3) is None
+        assert cache.test_and_set('a', 10) == 1
+        assert cache.test_and_set('d', 4) is None
+        assert list(cache._data.keys()) == ['c', 'a', 'd']
+        assert cache.test_and_set('a', 100) == 1
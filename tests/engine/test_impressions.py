@@ -1,19 +1,24 @@
 """Impression manager, observer & hasher tests."""
-from datetime import datetime
+import hashlib
+import time
+from functools import lru_cache
 import unittest.mock as mock
 import pytest
 from splitio.engine.impressions.impressions import Manager, ImpressionsMode
-from splitio.engine.impressions.manager import Hasher, Observer, Counter, truncate_time
+from splitio.engine.impressions.manager import Hasher, Observer, Counter, truncate_time, blake2b_64, \
+    str_hash_64
 from splitio.engine.impressions.strategies import StrategyDebugMode, StrategyOptimizedMode, StrategyNoneMode
 from splitio.models.impressions import Impression
-from splitio.client.listener import ImpressionListenerWrapper
 import splitio.models.telemetry as ModelTelemetry
 from splitio.engine.telemetry import TelemetryStorageProducer
 from splitio.storage.inmemmory import InMemoryTelemetryStorage
 
+_mk = lru_cache(maxsize=None)(Impression)  # impressions are immutable, share identical ones
+
+
 def utctime_ms_reimplement():
     """Re-implementation of utctime_ms to avoid conflicts with mock/patching."""
-    return int((datetime.utcnow() - datetime(1970, 1, 1)).total_seconds() * 1000)
+    return int(time.time() * 1000)
 
 
 class ImpressionHasherTests(object):
@@ -23,18 +28,34 @@ class ImpressionHasherTests(object):
         """Test that change in any field changes the resulting hash."""
         total = set()
         hasher = Hasher()
-        total.add(hasher.process(Impression('key1', 'feature1', 'on', 'killed', 123, None, 456)))
-        total.add(hasher.process(Impression('key2', 'feature1', 'on', 'killed', 123, None, 456)))
-        total.add(hasher.process(Impression('key1', 'feature2', 'on', 'killed', 123, None, 456)))
-        total.add(hasher.process(Impression('key1', 'feature1', 'off', 'killed', 123, None, 456)))
-        total.add(hasher.process(Impression('key1', 'feature1', 'on', 'not killed', 123, None, 456)))
-        total.add(hasher.process(Impression('key1', 'feature1', 'on', 'killed', 321, None, 456)))
+        total.add(hasher.process(_mk('key1', 'feature1', 'on', 'killed', 123, None, 456)))
+        total.add(hasher.process(_mk('key2', 'feature1', 'on', 'killed', 123, None, 456)))
+        total.add(hasher.process(_mk('key1', 'feature2', 'on', 'killed', 123, None, 456)))
+        total.add(hasher.process(_mk('key1', 'feature1', 'off', 'killed', 123, None, 456)))
+        total.add(hasher.process(_mk('key1', 'feature1', 'on', 'not killed', 123, None, 456)))
+        total.add(hasher.process(_mk('key1', 'feature1', 'on', 'killed', 321, None, 456)))
         assert len(total) == 6
 
         # Re-adding the first-one should not increase the number of different hashes
-        total.add(hasher.process(Impression('key1', 'feature1', 'on', 'killed', 123, None, 456)))
+        total.add(hasher.process(_mk('key1', 'feature1', 'on', 'killed', 123, None, 456)))
         assert len(total) == 6
 
+    def test_blake2b_64(self):
+        """Test that the 32 bits builds fallback hash function is deterministic, seeded & fits in 64 bits."""
+        assert blake2b_64('key1\x1ffeature1', 0) == blake2b_64('key1\x1ffeature1', 0)
+        assert blake2b_64('key1\x1ffeature1', 0) != blake2b_64('key1\x1ffeature1', 1)
+        assert blake2b_64('key1\x1ffeature1', 0) != blake2b_64('key1:feature1', 0)
+        assert 0 <= blake2b_64('key1', 0) < 2 ** 64
+        assert blake2b_64('key1', 0) == int.from_bytes(
+            hashlib.blake2b(b'key1', digest_size=8, salt=bytes(16)).digest(), 'little')
+
+
+    def test_str_hash_64(self):
+        """Test that the interpreter backed hash function is stable within the process & seeded."""
+        assert str_hash_64('key1\x1ffeature1', 0) == str_hash_64('key1\x1ffeature1', 0)
+        assert str_hash_64('key1\x1ffeature1', 0) != str_hash_64('key1\x1ffeature1', 1)
+        assert str_hash_64('key1\x1ffeature1', 0) != str_hash_64('key1:feature1', 0)
+
 
 class ImpressionObserverTests(object):
     """Test impression observer behaviour."""
@@ -42,26 +63,54 @@ class ImpressionObserverTests(object):
     def test_previous_time_properly_calculated(self):
         """Test that the previous time is properly set."""
         observer = Observer(5)
-        assert (observer.test_and_set(Impression('key1', 'f1', 'on', 'killed', 123, None, 456))
-                == Impression('key1', 'f1', 'on', 'killed', 123, None, 456))
-        assert (observer.test_and_set(Impression('key1', 'f1', 'on', 'killed', 123, None, 457))
-                == Impression('key1', 'f1', 'on', 'killed', 123, None, 457, 456))
+        assert (observer.test_and_set(_mk('key1', 'f1', 'on', 'killed', 123, None, 456))
+                == _mk('key1', 'f1', 'on', 'killed', 123, None, 456))
+        assert (observer.test_and_set(_mk('key1', 'f1', 'on', 'killed', 123, None, 457))
+                == _mk('key1', 'f1', 'on', 'killed', 123, None, 457, 456))
 
         # Add 5 new impressions to evict the first one and check that previous time is None again
-        assert (observer.test_and_set(Impression('key2', 'f1', 'on', 'killed', 123, None, 456))
-                == Impression('key2', 'f1', 'on', 'killed', 123, None, 456))
-        assert (observer.test_and_set(Impression('key3', 'f1', 'on', 'killed', 123, None, 456))
-                == Impression('key3', 'f1', 'on', 'killed', 123, None, 456))
-        assert (observer.test_and_set(Impression('key4', 'f1', 'on', 'killed', 123, None, 456))
-                == Impression('key4', 'f1', 'on', 'killed', 123, None, 456))
-        assert (observer.test_and_set(Impression('key5', 'f1', 'on', 'killed', 123, None, 456))
-                == Impression('key5', 'f1', 'on', 'killed', 123, None, 456))
-        assert (observer.test_and_set(Impression('key6', 'f1', 'on', 'killed', 123, None, 456))
-                == Impression('key6', 'f1', 'on', 'killed', 123, None, 456))
+        assert (observer.test_and_set(_mk('key2', 'f1', 'on', 'killed', 123, None, 456))
+                == _mk('key2', 'f1', 'on', 'killed', 123, None, 456))
+        assert (observer.test_and_set(_mk('key3', 'f1', 'on', 'killed', 123, None, 456))
+                == _mk('key3', 'f1', 'on', 'killed', 123, None, 456))
+        assert (observer.test_and_set(_mk('key4', 'f1', 'on', 'killed', 123, None, 456))
+                == _mk('key4', 'f1', 'on', 'killed', 123, None, 456))
+        assert (observer.test_and_set(_mk('key5', 'f1', 'on', 'killed', 123, None, 456))
+                == _mk('key5', 'f1', 'on', 'killed', 123, None, 456))
+        assert (observer.test_and_set(_mk('key6', 'f1', 'on', 'killed', 123, None, 456))
+                == _mk('key6', 'f1', 'on', 'killed', 123, None, 456))
 
         # Re-process the first-one
-        assert (observer.test_and_set(Impression('key1', 'f1', 'on', 'killed', 123, None, 456))
-                == Impression('key1', 'f1', 'on', 'killed', 123, None, 456))
+        assert (observer.test_and_set(_mk('key1', 'f1', 'on', 'killed', 123, None, 456))
+                == _mk('key1', 'f1', 'on', 'killed', 123, None, 456))
+
+    def test_unseen_impressions_are_not_copied(self):
+        """Test that impressions whose previous time doesn't change are returned as they are."""
+        observer = Observer(5)
+        impression = _mk('key1', 'f1', 'on', 'killed', 123, None, 456)
+        assert observer.test_and_set(impression) is impression
+        observed = observer.test_and_set(_mk('key1', 'f1', 'on', 'killed', 123, None, 457))
+        assert observed.previous_time == 456
+        assert observer.test_and_set(observed) is observed
+
+    def test_changed_evaluations_are_not_previously_seen(self):
+        """Test that the same key & feature with a different evaluation result gets no previous time."""
+        observer = Observer(5)
+        observer.test_and_set(_mk('key1', 'f1', 'on', 'killed', 123, None, 456))
+        assert observer.test_and_set(_mk('key1', 'f1', 'off', 'killed', 123, None, 457)).previous_time is None
+        assert observer.test_and_set(_mk('key1', 'f1', 'on', 'default rule', 123, None, 458)).previous_time is None
+        assert observer.test_and_set(_mk('key1', 'f1', 'on', 'killed', 124, None, 459)).previous_time is None
+        assert observer.test_and_set(_mk('key1', 'f1', 'on', 'killed', 123, None, 460)).previous_time == 456
+
+    def test_recently_seen_impressions_are_kept(self):
+        """Test that eviction is least recently used rather than first in, first out."""
+        observer = Observer(2)
+        observer.test_and_set(_mk('key1', 'f1', 'on', 'killed', 123, None, 456))
+        observer.test_and_set(_mk('key2', 'f1', 'on', 'killed', 123, None, 456))
+        observer.test_and_set(_mk('key1', 'f1', 'on', 'killed', 123, None, 457))
+        observer.test_and_set(_mk('key3', 'f1', 'on', 'killed', 123, None, 458))
+        assert observer.test_and_set(_mk('key1', 'f1', 'on', 'killed', 123, None, 459)).previous_time == 456
+        assert observer.test_and_set(_mk('key2', 'f1', 'on', 'killed', 123, None, 459)).previous_time is None
 
 
 class ImpressionCounterTests(object):
@@ -72,15 +121,15 @@ class ImpressionCounterTests(object):
         counter = Counter()
         utc_now = utctime_ms_reimplement()
         utc_1_hour_after = utc_now + (3600 * 1000)
-        counter.track([Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now),
-                       Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now),
-                       Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now)])
+        counter.track([_mk('k1', 'f1', 'on', 'l1', 123, None, utc_now),
+                       _mk('k1', 'f1', 'on', 'l1', 123, None, utc_now),
+                       _mk('k1', 'f1', 'on', 'l1', 123, None, utc_now)])
 
-        counter.track([Impression('k1', 'f2', 'on', 'l1', 123, None, utc_now),
-                       Impression('k1', 'f2', 'on', 'l1', 123, None, utc_now)])
+        counter.track([_mk('k1', 'f2', 'on', 'l1', 123, None, utc_now),
+                       _mk('k1', 'f2', 'on', 'l1', 123, None, utc_now)])
 
-        counter.track([Impression('k1', 'f1', 'on', 'l1', 123, None, utc_1_hour_after),
-                       Impression('k1', 'f2', 'on', 'l1', 123, None, utc_1_hour_after)])
+        counter.track([_mk('k1', 'f1', 'on', 'l1', 123, None, utc_1_hour_after),
+                       _mk('k1', 'f2', 'on', 'l1', 123, None, utc_1_hour_after)])
 
         assert set(counter.pop_all()) == set([
             Counter.CountPerFeature('f1', truncate_time(utc_now), 3),
@@ -91,252 +140,101 @@ class ImpressionCounterTests(object):
         assert set(counter.pop_all()) == set()
 
 
-class ImpressionManagerTests(object):
-    """Test impressions manager in all of its configurations."""
+@pytest.fixture(scope='module')
+def seed_utc_now():
+    """Half past the current hour, computed once for the whole module."""
+    return truncate_time(utctime_ms_reimplement()) + 1800 * 1000
 
-    def test_standalone_optimized(self, mocker):
-        """Test impressions manager in optimized mode with sdk in standalone mode."""
 
-        # Mock utc_time function to be able to play with the clock
-        utc_now = truncate_time(utctime_ms_reimplement()) + 1800 * 1000
-        utc_time_mock = mocker.Mock()
-        utc_time_mock.return_value = utc_now
-        mocker.patch('splitio.engine.impressions.strategies.utctime_ms', return_value=utc_time_mock())
-        telemetry_storage = InMemoryTelemetryStorage()
-        telemetry_producer = TelemetryStorageProducer(telemetry_storage)
-        telemetry_runtime_producer = telemetry_producer.get_telemetry_runtime_producer()
+class FakeClock(object):  # pylint: disable=too-few-public-methods
+    """Settable stand-in for utctime_ms."""
 
-        manager = Manager(StrategyOptimizedMode(Counter()), telemetry_runtime_producer)  # no listener
-        assert manager._strategy._counter is not None
-        assert manager._strategy._observer is not None
-        assert manager._listener is None
-        assert isinstance(manager._strategy, StrategyOptimizedMode)
+    __slots__ = ('now_ms',)
 
-        # An impression that hasn't happened in the last hour (pt = None) should be tracked
-        imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-3), None),
-            (Impression('k1', 'f2', 'on', 'l1', 123, None, utc_now-3), None)
-        ])
+    def __init__(self, now_ms):
+        """Class constructor."""
+        self.now_ms = now_ms
 
-        assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-3),
-                        Impression('k1', 'f2', 'on', 'l1', 123, None, utc_now-3)]
+    def get(self):
+        """Return the perceived time in milliseconds."""
+        return self.now_ms
 
-        # Tracking the same impression a ms later should be empty
-        imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-2), None)
-        ])
-        assert imps == []
-        assert(telemetry_storage._counters._impressions_deduped == 1)
-
-        # Tracking an impression with a different key makes it to the queue
-        imps = manager.process_impressions([
-            (Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-1), None)
-        ])
-        assert imps == [Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-1)]
 
-        # Advance the perceived clock one hour
-        old_utc = utc_now  # save it to compare captured impressions
-        utc_now += 3600 * 1000
-        utc_time_mock.return_value = utc_now
-        mocker.patch('splitio.engine.impressions.strategies.utctime_ms', return_value=utc_time_mock())
-
-        # Track the same impressions but "one hour later"
-        imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1), None),
-            (Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2), None)
-        ])
-        assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1, old_utc-3),
-                        Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2, old_utc-1)]
-
-        assert len(manager._strategy._observer._cache._data) == 3  # distinct impressions seen
-        assert len(manager._strategy._counter._data) == 2  # 2 distinct features. 1 seen in 2 different timeframes
-
-        assert set(manager._strategy._counter.pop_all()) == set([
-            Counter.CountPerFeature('f1', truncate_time(old_utc), 1),
-            Counter.CountPerFeature('f1', truncate_time(utc_now), 2)
-        ])
-
-        # Test counting only from the second impression
-        imps = manager.process_impressions([
-            (Impression('k3', 'f3', 'on', 'l1', 123, None, utc_now-1), None)
-        ])
-        assert set(manager._strategy._counter.pop_all()) == set([])
-
-        imps = manager.process_impressions([
-            (Impression('k3', 'f3', 'on', 'l1', 123, None, utc_now-1), None)
-        ])
-        assert set(manager._strategy._counter.pop_all()) == set([
-            Counter.CountPerFeature('f3', truncate_time(utc_now), 1)
-        ])
-
-    def test_standalone_debug(self, mocker):
-        """Test impressions manager in debug mode with sdk in standalone mode."""
-
-        # Mock utc_time function to be able to play with the clock
-        utc_now = truncate_time(utctime_ms_reimplement()) + 1800 * 1000
-        utc_time_mock = mocker.Mock()
-        utc_time_mock.return_value = utc_now
-        mocker.patch('splitio.engine.impressions.strategies.utctime_ms', return_value=utc_time_mock())
-
-        manager = Manager(StrategyDebugMode(), mocker.Mock())  # no listener
-        assert manager._strategy._observer is not None
-        assert manager._listener is None
-        assert isinstance(manager._strategy, StrategyDebugMode)
-
-        # An impression that hasn't happened in the last hour (pt = None) should be tracked
-        imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-3), None),
-            (Impression('k1', 'f2', 'on', 'l1', 123, None, utc_now-3), None)
-        ])
-        assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-3),
-                        Impression('k1', 'f2', 'on', 'l1', 123, None, utc_now-3)]
-
-        # Tracking the same impression a ms later should return the impression
-        imps = manager.process_impressions([
-            (Impression('k1',  'f1', 'on', 'l1', 123, None, utc_now-2), None)
-        ])
-        assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-2, utc_now-3)]
-
-        # Tracking a in impression with a different key makes it to the queue
-        imps = manager.process_impressions([
-            (Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-1), None)
-        ])
-        assert imps == [Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-1)]
-
-        # Advance the perceived clock one hour
-        old_utc = utc_now  # save it to compare captured impressions
-        utc_now += 3600 * 1000
-        utc_time_mock.return_value = utc_now
-        mocker.patch('splitio.engine.impressions.strategies.utctime_ms', return_value=utc_time_mock())
-
-        # Track the same impressions but "one hour later"
-        imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1), None),
-            (Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2), None)
-        ])
-        assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1, old_utc-3),
-                        Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2, old_utc-1)]
-
-        assert len(manager._strategy._observer._cache._data) == 3  # distinct impressions seen
-
-    def test_standalone_none(self, mocker):
-        """Test impressions manager in none mode with sdk in standalone mode."""
+@pytest.fixture
+def clock(monkeypatch, seed_utc_now):
+    """Set the strategies clock at `seed_utc_now`. Advance it through `clock.now_ms`."""
+    fake_clock = FakeClock(seed_utc_now)
+    monkeypatch.setattr('splitio.engine.impressions.strategies.utctime_ms', fake_clock.get)
+    return fake_clock
 
-        # Mock utc_time function to be able to play with the clock
-        utc_now = truncate_time(utctime_ms_reimplement()) + 1800 * 1000
-        utc_time_mock = mocker.Mock()
-        utc_time_mock.return_value = utc_now
-        mocker.patch('splitio.engine.impressions.strategies.utctime_ms', return_value=utc_time_mock())
 
-        manager = Manager(StrategyNoneMode(Counter()), mocker.Mock())  # no listener
-        assert manager._strategy._counter is not None
-        assert manager._listener is None
-        assert isinstance(manager._strategy, StrategyNoneMode)
+class RecordingListener(object):  # pylint: disable=too-few-public-methods
+    """Impression listener wrapper stand-in that records every impression it's handed."""
 
-        # no impressions are tracked, only counter and mtk
-        imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-3), None),
-            (Impression('k1', 'f2', 'on', 'l1', 123, None, utc_now-3), None)
-        ])
-        assert imps == []
-        assert [Counter.CountPerFeature(k.feature, k.timeframe, v)
-                for (k, v) in manager._strategy._counter._data.items()] == [
-            Counter.CountPerFeature('f1', truncate_time(utc_now-3), 1),
-            Counter.CountPerFeature('f2', truncate_time(utc_now-3), 1)]
-        assert manager._strategy.get_unique_keys_tracker()._cache == {
-            'f1': set({'k1'}),
-            'f2': set({'k1'})}
+    __slots__ = ('calls',)
 
-        # Tracking the same impression a ms later should not return the impression and no change on mtk cache
-        imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-2), None)
-        ])
-        assert imps == []
-        assert manager._strategy.get_unique_keys_tracker()._cache == {'f1': set({'k1'}), 'f2': set({'k1'})}
+    def __init__(self):
+        """Class constructor."""
+        self.calls = []
 
-        # Tracking an impression with a different key, will only increase mtk
-        imps = manager.process_impressions([
-            (Impression('k3', 'f1', 'on', 'l1', 123, None, utc_now-1), None)
-        ])
-        assert imps == []
-        assert manager._strategy.get_unique_keys_tracker()._cache == {
-            'f1': set({'k1', 'k3'}),
-            'f2': set({'k1'})}
+    def log_impressions(self, impressions):
+        """Record a batch of (impression, attributes) pairs."""
+        self.calls.extend(impressions)
 
-        # Advance the perceived clock one hour
-        old_utc = utc_now  # save it to compare captured impressions
-        utc_now += 3600 * 1000
-        utc_time_mock.return_value = utc_now
-        mocker.patch('splitio.engine.impressions.strategies.utctime_ms', return_value=utc_time_mock())
 
-        # Track the same impressions but "one hour later", no changes on mtk
-        imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1), None),
-            (Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2), None)
-        ])
-        assert imps == []
-        assert manager._strategy.get_unique_keys_tracker()._cache == {
-            'f1': set({'k1', 'k3', 'k2'}),
-            'f2': set({'k1'})}
+def _build_manager(mocker, strategy, with_listener, telemetry_runtime_producer=None):
+    """Build an impressions manager with an optional recording listener."""
+    listener = RecordingListener() if with_listener else None
+    manager = Manager(strategy, telemetry_runtime_producer or mocker.Mock(), listener=listener)
+    assert (manager._listener is not None) == with_listener
+    return manager, listener
 
-        assert len(manager._strategy._counter._data) == 3  # 2 distinct features. 1 seen in 2 different timeframes
 
-        assert set(manager._strategy._counter.pop_all()) == set([
-            Counter.CountPerFeature('f1', truncate_time(old_utc), 3),
-            Counter.CountPerFeature('f2', truncate_time(old_utc), 1),
-            Counter.CountPerFeature('f1', truncate_time(utc_now), 2)
-        ])
+class ImpressionManagerTests(object):
+    """Test impressions manager in all of its configurations."""
 
-    def test_standalone_optimized_listener(self, mocker):
+    @pytest.mark.parametrize('with_listener', [False, True])
+    def test_standalone_optimized(self, mocker, clock, with_listener):
         """Test impressions manager in optimized mode with sdk in standalone mode."""
+        utc_now = clock.now_ms
+        t1, t2, t3 = utc_now - 1, utc_now - 2, utc_now - 3  # ms before the perceived time (o1..o3 once it advances)
+        telemetry_storage = InMemoryTelemetryStorage()
+        telemetry_producer = TelemetryStorageProducer(telemetry_storage)
+        telemetry_runtime_producer = telemetry_producer.get_telemetry_runtime_producer()
 
-        # Mock utc_time function to be able to play with the clock
-        utc_now = truncate_time(utctime_ms_reimplement()) + 1800 * 1000
-        utc_time_mock = mocker.Mock()
-        utc_time_mock.return_value = utc_now
-#        mocker.patch('splitio.util.time.utctime_ms', return_value=utc_time_mock)
-        mocker.patch('splitio.engine.impressions.strategies.utctime_ms', return_value=utc_time_mock())
-
-        listener = mocker.Mock(spec=ImpressionListenerWrapper)
-        manager = Manager(StrategyOptimizedMode(Counter()), mocker.Mock(), listener=listener)
+        manager, listener = _build_manager(mocker, StrategyOptimizedMode(Counter()), with_listener,
+                                           telemetry_runtime_producer)
         assert manager._strategy._counter is not None
         assert manager._strategy._observer is not None
-        assert manager._listener is not None
         assert isinstance(manager._strategy, StrategyOptimizedMode)
 
-        # An impression that hasn't happened in the last hour (pt = None) should be tracked
-        imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-3), None),
-            (Impression('k1', 'f2', 'on', 'l1', 123, None, utc_now-3), None)
-        ])
-        assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-3),
-                        Impression('k1', 'f2', 'on', 'l1', 123, None, utc_now-3)]
-
-        # Tracking the same impression a ms later should return empty
-        imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-2), None)
-        ])
-        assert imps == []
-
-        # Tracking a in impression with a different key makes it to the queue
+        # In a single batch: impressions that haven't happened in the last hour (pt = None) are tracked,
+        # the same impression a ms later is dropped & one with a different key makes it to the queue
         imps = manager.process_impressions([
-            (Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-1), None)
-        ])
-        assert imps == [Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-1)]
+            (_mk('k1', 'f1', 'on', 'l1', 123, None, t3), None),
+            (_mk('k1', 'f2', 'on', 'l1', 123, None, t3), None),
+            (_mk('k1', 'f1', 'on', 'l1', 123, None, t2), None),
+            (_mk('k2', 'f1', 'on', 'l1', 123, None, t1), None)
+        ])
+        assert imps[:2] == [_mk('k1', 'f1', 'on', 'l1', 123, None, t3),
+                            _mk('k1', 'f2', 'on', 'l1', 123, None, t3)]
+        assert imps[2:] == [_mk('k2', 'f1', 'on', 'l1', 123, None, t1)]
+        assert(telemetry_storage._counters._impressions_deduped == 1)
 
         # Advance the perceived clock one hour
         old_utc = utc_now  # save it to compare captured impressions
-        utc_now += 3600 * 1000
-        utc_time_mock.return_value = utc_now
-        mocker.patch('splitio.engine.impressions.strategies.utctime_ms', return_value=utc_time_mock())
+        o1, o2, o3 = t1, t2, t3
+        clock.now_ms += 3600 * 1000
+        utc_now = clock.now_ms
+        t1, t2, t3 = utc_now - 1, utc_now - 2, utc_now - 3
 
         # Track the same impressions but "one hour later"
         imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1), None),
-            (Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2), None)
+            (_mk('k1', 'f1', 'on', 'l1', 123, None, t1), None),
+            (_mk('k2', 'f1', 'on', 'l1', 123, None, t2), None)
         ])
-        assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1, old_utc-3),
-                        Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2, old_utc-1)]
+        assert imps == [_mk('k1', 'f1', 'on', 'l1', 123, None, t1, o3),
+                        _mk('k2', 'f1', 'on', 'l1', 123, None, t2, o1)]
 
         assert len(manager._strategy._observer._cache._data) == 3  # distinct impressions seen
         assert len(manager._strategy._counter._data) == 2  # 2 distinct features. 1 seen in 2 different timeframes
@@ -346,149 +244,131 @@ class ImpressionManagerTests(object):
             Counter.CountPerFeature('f1', truncate_time(utc_now), 2)
         ])
 
-        assert listener.log_impression.mock_calls == [
-            mocker.call(Impression('k1', 'f1', 'on', 'l1', 123, None, old_utc-3), None),
-            mocker.call(Impression('k1', 'f2', 'on', 'l1', 123, None, old_utc-3), None),
-            mocker.call(Impression('k1', 'f1', 'on', 'l1', 123, None, old_utc-2, old_utc-3), None),
-            mocker.call(Impression('k2', 'f1', 'on', 'l1', 123, None, old_utc-1), None),
-            mocker.call(Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1, old_utc-3), None),
-            mocker.call(Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2, old_utc-1), None)
-        ]
+        if with_listener:
+            assert listener.calls == [
+                (_mk('k1', 'f1', 'on', 'l1', 123, None, o3), None),
+                (_mk('k1', 'f2', 'on', 'l1', 123, None, o3), None),
+                (_mk('k1', 'f1', 'on', 'l1', 123, None, o2, o3), None),
+                (_mk('k2', 'f1', 'on', 'l1', 123, None, o1), None),
+                (_mk('k1', 'f1', 'on', 'l1', 123, None, t1, o3), None),
+                (_mk('k2', 'f1', 'on', 'l1', 123, None, t2, o1), None)
+            ]
 
         # Test counting only from the second impression
         imps = manager.process_impressions([
-            (Impression('k3', 'f3', 'on', 'l1', 123, None, utc_now-1), None)
+            (_mk('k3', 'f3', 'on', 'l1', 123, None, t1), None)
         ])
         assert set(manager._strategy._counter.pop_all()) == set([])
 
         imps = manager.process_impressions([
-            (Impression('k3', 'f3', 'on', 'l1', 123, None, utc_now-1), None)
+            (_mk('k3', 'f3', 'on', 'l1', 123, None, t1), None)
         ])
         assert set(manager._strategy._counter.pop_all()) == set([
             Counter.CountPerFeature('f3', truncate_time(utc_now), 1)
         ])
 
-    def test_standalone_debug_listener(self, mocker):
-        """Test impressions manager in optimized mode with sdk in standalone mode."""
-
-        # Mock utc_time function to be able to play with the clock
-        utc_now = truncate_time(utctime_ms_reimplement()) + 1800 * 1000
-        utc_time_mock = mocker.Mock()
-        utc_time_mock.return_value = utc_now
-        mocker.patch('splitio.engine.impressions.strategies.utctime_ms', return_value=utc_time_mock())
-
-        imps = []
-        listener = mocker.Mock(spec=ImpressionListenerWrapper)
-        manager = Manager(StrategyDebugMode(), mocker.Mock(), listener=listener)
-        assert manager._listener is not None
+    @pytest.mark.parametrize('with_listener', [False, True])
+    def test_standalone_debug(self, mocker, clock, with_listener):
+        """Test impressions manager in debug mode with sdk in standalone mode."""
+        utc_now = clock.now_ms
+        t1, t2, t3 = utc_now - 1, utc_now - 2, utc_now - 3  # ms before the perceived time (o1..o3 once it advances)
+        manager, listener = _build_manager(mocker, StrategyDebugMode(), with_listener)
+        assert manager._strategy._observer is not None
         assert isinstance(manager._strategy, StrategyDebugMode)
 
-        # An impression that hasn't happened in the last hour (pt = None) should be tracked
-        imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-3), None),
-            (Impression('k1', 'f2', 'on', 'l1', 123, None, utc_now-3), None)
-        ])
-        assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-3),
-                        Impression('k1', 'f2', 'on', 'l1', 123, None, utc_now-3)]
-
-        # Tracking the same impression a ms later should return the imp
+        # In a single batch: impressions that haven't happened in the last hour (pt = None) are tracked,
+        # the same impression a ms later is returned with its previous time & one with a different key is queued
         imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-2), None)
+            (_mk('k1', 'f1', 'on', 'l1', 123, None, t3), None),
+            (_mk('k1', 'f2', 'on', 'l1', 123, None, t3), None),
+            (_mk('k1', 'f1', 'on', 'l1', 123, None, t2), None),
+            (_mk('k2', 'f1', 'on', 'l1', 123, None, t1), None)
         ])
-        assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-2, utc_now-3)]
-
-        # Tracking a in impression with a different key makes it to the queue
-        imps = manager.process_impressions([
-            (Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-1), None)
-        ])
-        assert imps == [Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-1)]
+        assert imps[:2] == [_mk('k1', 'f1', 'on', 'l1', 123, None, t3),
+                            _mk('k1', 'f2', 'on', 'l1', 123, None, t3)]
+        assert imps[2:3] == [_mk('k1', 'f1', 'on', 'l1', 123, None, t2, t3)]
+        assert imps[3:] == [_mk('k2', 'f1', 'on', 'l1', 123, None, t1)]
 
         # Advance the perceived clock one hour
-        old_utc = utc_now  # save it to compare captured impressions
-        utc_now += 3600 * 1000
-        utc_time_mock.return_value = utc_now
-        mocker.patch('splitio.engine.impressions.strategies.utctime_ms', return_value=utc_time_mock())
+        o1, o2, o3 = t1, t2, t3
+        clock.now_ms += 3600 * 1000
+        utc_now = clock.now_ms
+        t1, t2, t3 = utc_now - 1, utc_now - 2, utc_now - 3
 
         # Track the same impressions but "one hour later"
         imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1), None),
-            (Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2), None)
+            (_mk('k1', 'f1', 'on', 'l1', 123, None, t1), None),
+            (_mk('k2', 'f1', 'on', 'l1', 123, None, t2), None)
         ])
-        assert imps == [Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1, old_utc-3),
-                        Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2, old_utc-1)]
+        assert imps == [_mk('k1', 'f1', 'on', 'l1', 123, None, t1, o3),
+                        _mk('k2', 'f1', 'on', 'l1', 123, None, t2, o1)]
 
         assert len(manager._strategy._observer._cache._data) == 3  # distinct impressions seen
 
-        assert listener.log_impression.mock_calls == [
-            mocker.call(Impression('k1', 'f1', 'on', 'l1', 123, None, old_utc-3), None),
-            mocker.call(Impression('k1', 'f2', 'on', 'l1', 123, None, old_utc-3), None),
-            mocker.call(Impression('k1', 'f1', 'on', 'l1', 123, None, old_utc-2, old_utc-3), None),
-            mocker.call(Impression('k2', 'f1', 'on', 'l1', 123, None, old_utc-1), None),
-            mocker.call(Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1, old_utc-3), None),
-            mocker.call(Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2, old_utc-1), None)
-        ]
-
-    def test_standalone_none_listener(self, mocker):
+        if with_listener:
+            assert listener.calls == [
+                (_mk('k1', 'f1', 'on', 'l1', 123, None, o3), None),
+                (_mk('k1', 'f2', 'on', 'l1', 123, None, o3), None),
+                (_mk('k1', 'f1', 'on', 'l1', 123, None, o2, o3), None),
+                (_mk('k2', 'f1', 'on', 'l1', 123, None, o1), None),
+                (_mk('k1', 'f1', 'on', 'l1', 123, None, t1, o3), None),
+                (_mk('k2', 'f1', 'on', 'l1', 123, None, t2, o1), None)
+            ]
+
+    @pytest.mark.parametrize('with_listener', [False, True])
+    def test_standalone_none(self, mocker, clock, with_listener):
         """Test impressions manager in none mode with sdk in standalone mode."""
-
-        # Mock utc_time function to be able to play with the clock
-        utc_now = truncate_time(utctime_ms_reimplement()) + 1800 * 1000
-        utc_time_mock = mocker.Mock()
-        utc_time_mock.return_value = utc_now
-        mocker.patch('splitio.engine.impressions.strategies.utctime_ms', return_value=utc_time_mock())
-
-        listener = mocker.Mock(spec=ImpressionListenerWrapper)
-        manager = Manager(StrategyNoneMode(Counter()), mocker.Mock(), listener=listener)
+        utc_now = clock.now_ms
+        t1, t2, t3 = utc_now - 1, utc_now - 2, utc_now - 3  # ms before the perceived time (o1..o3 once it advances)
+        manager, listener = _build_manager(mocker, StrategyNoneMode(Counter()), with_listener)
         assert manager._strategy._counter is not None
-        assert manager._listener is not None
         assert isinstance(manager._strategy, StrategyNoneMode)
 
-        # An impression that hasn't happened in the last hour (pt = None) should not be tracked
+        # no impressions are tracked, only counter and mtk
         imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-3), None),
-            (Impression('k1', 'f2', 'on', 'l1', 123, None, utc_now-3), None)
+            (_mk('k1', 'f1', 'on', 'l1', 123, None, t3), None),
+            (_mk('k1', 'f2', 'on', 'l1', 123, None, t3), None)
         ])
         assert imps == []
-        assert [Counter.CountPerFeature(k.feature, k.timeframe, v)
-                for (k, v) in manager._strategy._counter._data.items()] == [
-            Counter.CountPerFeature('f1', truncate_time(utc_now-3), 1),
-            Counter.CountPerFeature('f2', truncate_time(utc_now-3), 1)]
+        assert [Counter.CountPerFeature(feature, hour * 3600 * 1000, v)
+                for ((feature, hour), v) in manager._strategy._counter._data.items()] == [
+            Counter.CountPerFeature('f1', truncate_time(t3), 1),
+            Counter.CountPerFeature('f2', truncate_time(t3), 1)]
         assert manager._strategy.get_unique_keys_tracker()._cache == {
             'f1': set({'k1'}),
             'f2': set({'k1'})}
 
-        # Tracking the same impression a ms later should return empty, no updates on mtk
+        # Tracking the same impression a ms later should not return the impression and no change on mtk cache
         imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-2), None)
+            (_mk('k1', 'f1', 'on', 'l1', 123, None, t2), None)
         ])
         assert imps == []
-        assert manager._strategy.get_unique_keys_tracker()._cache == {
-            'f1': set({'k1'}),
-            'f2': set({'k1'})}
+        assert manager._strategy.get_unique_keys_tracker()._cache == {'f1': set({'k1'}), 'f2': set({'k1'})}
 
-        # Tracking a in impression with a different key update mtk
+        # Tracking an impression with a different key, will only increase mtk
         imps = manager.process_impressions([
-            (Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-1), None)
+            (_mk('k3', 'f1', 'on', 'l1', 123, None, t1), None)
         ])
         assert imps == []
         assert manager._strategy.get_unique_keys_tracker()._cache == {
-            'f1': set({'k1', 'k2'}),
+            'f1': set({'k1', 'k3'}),
             'f2': set({'k1'})}
 
         # Advance the perceived clock one hour
         old_utc = utc_now  # save it to compare captured impressions
-        utc_now += 3600 * 1000
-        utc_time_mock.return_value = utc_now
-        mocker.patch('splitio.engine.impressions.strategies.utctime_ms', return_value=utc_time_mock())
+        o1, o2, o3 = t1, t2, t3
+        clock.now_ms += 3600 * 1000
+        utc_now = clock.now_ms
+        t1, t2, t3 = utc_now - 1, utc_now - 2, utc_now - 3
 
-        # Track the same impressions but "one hour later"
+        # Track the same impressions but "one hour later", no changes on mtk
         imps = manager.process_impressions([
-            (Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1), None),
-            (Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2), None)
+            (_mk('k1', 'f1', 'on', 'l1', 123, None, t1), None),
+            (_mk('k2', 'f1', 'on', 'l1', 123, None, t2), None)
         ])
         assert imps == []
         assert manager._strategy.get_unique_keys_tracker()._cache == {
-            'f1': set({'k1', 'k2'}),
+            'f1': set({'k1', 'k3', 'k2'}),
             'f2': set({'k1'})}
 
         assert len(manager._strategy._counter._data) == 3  # 2 distinct features. 1 seen in 2 different timeframes
@@ -499,11 +379,12 @@ class ImpressionManagerTests(object):
             Counter.CountPerFeature('f1', truncate_time(utc_now), 2)
         ])
 
-        assert listener.log_impression.mock_calls == [
-            mocker.call(Impression('k1', 'f1', 'on', 'l1', 123, None, old_utc-3), None),
-            mocker.call(Impression('k1', 'f2', 'on', 'l1', 123, None, old_utc-3), None),
-            mocker.call(Impression('k1', 'f1', 'on', 'l1', 123, None, old_utc-2, None), None),
-            mocker.call(Impression('k2', 'f1', 'on', 'l1', 123, None, old_utc-1), None),
-            mocker.call(Impression('k1', 'f1', 'on', 'l1', 123, None, utc_now-1, None), None),
-            mocker.call(Impression('k2', 'f1', 'on', 'l1', 123, None, utc_now-2, None), None)
-        ]
\ No newline at end of file
+        if with_listener:
+            assert listener.calls == [
+                (_mk('k1', 'f1', 'on', 'l1', 123, None, o3), None),
+                (_mk('k1', 'f2', 'on', 'l1', 123, None, o3), None),
+                (_mk('k1', 'f1', 'on', 'l1', 123, None, o2, None), None),
+                (_mk('k3', 'f1', 'on', 'l1', 123, None, o1), None),
+                (_mk('k1', 'f1', 'on', 'l1', 123, None, t1, None), None),
+                (_mk('k2', 'f1', 'on', 'l1', 123, None, t2, None), None)
+            ]
@@ -61,3 +61,13 @@ class UniqueKeysTrackerTests(object):
         assert(tracker._current_cache_size == (cache_size + (cache_size / 2)))
         assert(len(tracker._cache[split1]) == cache_size)
         assert(len(tracker._cache[split2]) == cache_size / 2)
+
+    def test_pending_keys_not_counted_twice(self, mocker):
+        tracker = UniqueKeysTracker()
+        assert(tracker.track('key1', 'feature1'))
+
+        # keys still pending to be sent are detected even after the filter is cleared
+        tracker.clear_filter()
+        assert(not tracker.track('key1', 'feature1'))
+        assert(tracker._current_cache_size == 1)
+        assert(tracker._cache == {'feature1': set(['key1'])})
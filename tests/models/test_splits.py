@@ -89,6 +89,10 @@ class SplitTests(object):
         split1 = splits.Split( 'some_split', 123, False, 'off', 'user', 'ACTIVE', 123, [cond1, cond2])
         assert split1.get_segment_names() == ['segment%d' % i for i in range(1, 5)]
 
+        # segment names are only computed once
+        assert split1.get_segment_names() == ['segment%d' % i for i in range(1, 5)]
+        assert len(cond1.get_segment_names.mock_calls) == 1
+
 
     def test_to_json(self):
         """Test json serialization."""
@@ -61,6 +61,31 @@ class PushManagerTests(object):
         assert(telemetry_storage._streaming_events._streaming_events[0]._type == StreamingEventTypes.TOKEN_REFRESH.value)
         assert(telemetry_storage._streaming_events._streaming_events[1]._type == StreamingEventTypes.CONNECTION_ESTABLISHED.value)
 
+    def test_cached_token_reconnection(self, mocker):
+        """Test that reusing a cached token schedules the refresh from its remaining life."""
+        api_mock = mocker.Mock()
+        api_mock.authenticate.return_value = Token(True, 'abc', {}, 2000000, 1000000)
+
+        sse_mock = mocker.Mock(spec=SplitSSEClient)
+        sse_mock.start.return_value = True
+        mocker.patch('splitio.push.manager.SplitSSEClient', return_value=sse_mock)
+        timer_mock = mocker.Mock()
+        mocker.patch('splitio.push.manager.Timer', new=timer_mock)
+        clock = mocker.patch('splitio.push.manager.get_current_monotonic_ms', return_value=5000)
+        telemetry_storage = InMemoryTelemetryStorage()
+        telemetry_producer = TelemetryStorageProducer(telemetry_storage)
+        telemetry_runtime_producer = telemetry_producer.get_telemetry_runtime_producer()
+        manager = PushManager(api_mock, mocker.Mock(), Queue(), mocker.Mock(), telemetry_runtime_producer)
+
+        manager._trigger_connection_flow()
+        assert timer_mock.mock_calls[-3] == mocker.call(1000000 - _TOKEN_REFRESH_GRACE_PERIOD, manager._token_refresh)
+        assert telemetry_storage.pop_token_refreshes() == 1
+
+        clock.return_value = 5000 + 300 * 1000
+        manager._trigger_connection_flow()
+        assert timer_mock.mock_calls[-3] == mocker.call(1000000 - 300 - _TOKEN_REFRESH_GRACE_PERIOD, manager._token_refresh)
+        assert telemetry_storage.pop_token_refreshes() == 0
+
     def test_connection_failure(self, mocker):
         """Test the connection fails to be established."""
         api_mock = mocker.Mock()
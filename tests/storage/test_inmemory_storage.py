@@ -178,6 +178,22 @@ class InMemorySplitStorageTests(object):
         assert storage.is_valid_traffic_type('user') is False
         assert storage.is_valid_traffic_type('account') is True
 
+    def test_put_remove_many(self):
+        """Test storing and removing splits in batches."""
+        storage = InMemorySplitStorage()
+        split1 = Split('split1', 123456789, False, 'on', 'user', 'ACTIVE', 1)
+        split2 = Split('split2', 123456789, False, 'on', 'account', 'ACTIVE', 1)
+
+        storage.put_many([split1, split2])
+        assert sorted(storage.get_split_names()) == ['split1', 'split2']
+        assert storage.is_valid_traffic_type('user') is True
+        assert storage.is_valid_traffic_type('account') is True
+
+        storage.remove_many(['split1', 'nonexistant_split'])
+        assert storage.get_split_names() == ['split2']
+        assert storage.is_valid_traffic_type('user') is False
+        assert storage.is_valid_traffic_type('account') is True
+
     def test_kill_locally(self):
         """Test kill local."""
         storage = InMemorySplitStorage()
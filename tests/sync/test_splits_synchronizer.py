@@ -11,6 +11,7 @@ from splitio.storage import SplitStorage
 from splitio.storage.inmemmory import InMemorySplitStorage
 from splitio.models.splits import Split
 from splitio.sync.split import SplitSynchronizer, LocalSplitSynchronizer, LocalhostMode
+from splitio.sync import util
 from tests.integration import splits_json
 
 class SplitsSynchronizerTests(object):
@@ -104,7 +105,7 @@ class SplitsSynchronizerTests(object):
         assert mocker.call(-1, FetchOptions(True)) in api.fetch_splits.mock_calls
         assert mocker.call(123, FetchOptions(True)) in api.fetch_splits.mock_calls
 
-        inserted_split = storage.put.mock_calls[0][1][0]
+        inserted_split = storage.put_many.mock_calls[0][1][0][0]
         assert isinstance(inserted_split, Split)
         assert inserted_split.name == 'some_name'
 
@@ -212,7 +213,7 @@ class SplitsSynchronizerTests(object):
         assert mocker.call(12345, FetchOptions(True, 1234)) in api.fetch_splits.mock_calls
         assert len(api.fetch_splits.mock_calls) == 8 # 2 ok + BACKOFF(2 since==till + 2 re-attempts) + CDN(2 since==till)
 
-        inserted_split = storage.put.mock_calls[0][1][0]
+        inserted_split = storage.put_many.mock_calls[0][1][0][0]
         assert isinstance(inserted_split, Split)
         assert inserted_split.name == 'some_name'
 
@@ -268,7 +269,7 @@ class LocalSplitsSynchronizerTests(object):
         }]
 
         def read_feature_flags_from_json_file(*args, **kwargs):
-                return splits, till
+                return splits, till, util._get_hash(json.dumps(splits))
 
         split_synchronizer = LocalSplitSynchronizer("split.json", storage, LocalhostMode.JSON)
         split_synchronizer._read_feature_flags_from_json_file = read_feature_flags_from_json_file
@@ -293,14 +294,14 @@ class LocalSplitsSynchronizerTests(object):
 
         # Should sync when changenumber is higher than stored
         till = 124
-        split_synchronizer._current_json_sha = "-1"
+        split_synchronizer._current_json_hash = None
         split_synchronizer.synchronize_splits()
         inserted_split = storage.get(splits[0]['name'])
         assert inserted_split.killed == False
 
         # Should sync when till is default (-1)
         till = -1
-        split_synchronizer._current_json_sha = "-1"
+        split_synchronizer._current_json_hash = None
         splits[0]['killed'] = True
         split_synchronizer.synchronize_splits()
         inserted_split = storage.get(splits[0]['name'])
@@ -357,6 +358,29 @@ class LocalSplitsSynchronizerTests(object):
         assert isinstance(inserted_split, Split)
         assert inserted_split.name == 'some_name'
 
+        # unchanged file is not parsed again
+        current_hash = split_synchronizer._current_json_hash
+        assert split_synchronizer._read_feature_flags_from_json_file("./splits.json") == (None, None, current_hash)
+
+        # recently modified files are read, but their stat is only cached once it's old enough
+        assert split_synchronizer._current_json_stat is None
+        os.utime("./splits.json", ns=(0, 0))
+        assert split_synchronizer._read_feature_flags_from_json_file("./splits.json") == (None, None, current_hash)
+
+        assert split_synchronizer._current_json_stat == (0, os.stat("./splits.json").st_size)
+
+        # same contents with a different modification time are not parsed either
+        split_synchronizer._current_json_stat = None
+        assert split_synchronizer._read_feature_flags_from_json_file("./splits.json") == (None, None, current_hash)
+
+        # malformed files keep failing until they're fixed
+        with open("./splits.json", "w") as f:
+            f.write('{"splits": [')
+        os.utime("./splits.json", ns=(0, 0))
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                split_synchronizer._read_feature_flags_from_json_file("./splits.json")
+
         os.remove("./splits.json")
 
     def test_json_elements_sanitization(self, mocker):
@@ -522,3 +546,10 @@ class LocalSplitsSynchronizerTests(object):
         target_split[0]["conditions"][1]['partitions'][0]['size'] = 0
         target_split[0]["conditions"][1]['partitions'][1]['size'] = 100
         assert (split_synchronizer._sanitize_feature_flag_elements(split) == target_split)
+
+        # test default rules added to different feature flags are independent copies
+        first = split_synchronizer._sanitize_condition({'name': 'first'})
+        second = split_synchronizer._sanitize_condition({'name': 'second', 'conditions': []})
+        assert first['conditions'] == second['conditions']
+        first['conditions'][0]['partitions'][0]['size'] = 50
+        assert second['conditions'][0]['partitions'][0]['size'] == 0
@@ -159,7 +159,7 @@ class SynchronizerTests(object):
         synchronizer = Synchronizer(split_synchronizers, mocker.Mock(spec=SplitTasks))
         synchronizer.sync_all()
 
-        inserted_split = split_storage.put.mock_calls[0][1][0]
+        inserted_split = split_storage.put_many.mock_calls[0][1][0][0]
         assert isinstance(inserted_split, Split)
         assert inserted_split.name == 'some_name'
 
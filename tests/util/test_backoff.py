@@ -43,3 +43,12 @@ class BackOffTests(object):  # pylint:disable=too-few-public-methods
         assert backoff.get() == 1800
         assert backoff.get() == 1800
         assert backoff.get() == 1800
+
+    def test_jitter(self):  # pylint:disable=no-self-use
+        """Test jittered waits stay within the exponential bounds."""
+        backoff = Backoff(1, 30, jitter=True)
+        for upper in [1, 2, 4, 8, 16, 30, 30]:
+            assert 0 <= backoff.get() <= upper
+
+        backoff.reset()
+        assert 0 <= backoff.get() <= 1
@@ -0,0 +1,15 @@
+"""JSON utilities unit tests."""
+import pytest
+
+from splitio.util import jsonutil
+
+
+class JsonUtilTests(object):  # pylint:disable=too-few-public-methods
+    """JSON utilities test cases."""
+
+    def test_loads(self):  # pylint:disable=no-self-use
+        """Test decoding from str and bytes."""
+        assert jsonutil.loads('{"a": [1, 2.5, "x", null, true]}') == {'a': [1, 2.5, 'x', None, True]}
+        assert jsonutil.loads(b'{"till": 123}') == {'till': 123}
+        with pytest.raises(ValueError):
+            jsonutil.loads('{invalid')
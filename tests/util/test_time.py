@@ -0,0 +1,15 @@
+"""Time utilities unit tests."""
+from datetime import datetime
+
+from splitio.util import time as time_utils
+
+
+class TimeUtilsTests(object):  # pylint:disable=too-few-public-methods
+    """Time utilities test cases."""
+
+    def test_utctime(self):  # pylint:disable=no-self-use
+        """Test that utc times match the elapsed time since the epoch."""
+        expected = (datetime.utcnow() - datetime(1970, 1, 1)).total_seconds()
+        assert abs(time_utils.utctime() - expected) < 1
+        assert isinstance(time_utils.utctime_ms(), int)
+        assert abs(time_utils.utctime_ms() - expected * 1000) < 1000